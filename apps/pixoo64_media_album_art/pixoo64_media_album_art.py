@@ -101,25 +101,38 @@ pixoo64_media_album_art:
 import aiohttp
 import asyncio
 import base64
+import copy
+import hashlib
 import json
 import logging
 import math
+import mmap
+import os
 import random
 import re
+import sqlite3
+import struct
+import sys
+import threading
 import time
 import textwrap 
 import colorsys
+import contextvars
 import urllib.parse
+import zlib
 from appdaemon.plugins.hass import hassapi as hass
-from collections import Counter, OrderedDict
-from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, OrderedDict, deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 from io import BytesIO
+from multiprocessing import get_context
+from types import SimpleNamespace
 from typing import Any, Dict, Optional, Tuple
 from functools import lru_cache
 
 # Third-party library imports
-from PIL import Image, ImageDraw, ImageFont, ImageEnhance, ImageFilter, ImageStat, ImageChops, ImageOps, UnidentifiedImageError
+from PIL import Image, ImageDraw, ImageFile, ImageFont, ImageEnhance, ImageFilter, ImageStat, UnidentifiedImageError
 
 try:
     from unidecode import unidecode
@@ -133,6 +146,12 @@ try:
 except ImportError:
     bidi_support = False
 
+try:
+    import numpy as np
+    numpy_support = True
+except ImportError:
+    numpy_support = False
+
 _LOGGER = logging.getLogger(__name__)
 
 # --- CONSTANTS & REGEX ---
@@ -159,6 +178,30 @@ COLOR_PALETTE = [
     (255, 255, 255)                                 
 ]
 
+def _srgb_channel_to_linear(v: float) -> float:
+    return v / 12.92 if v <= 0.03928 else ((v + 0.055) / 1.055) ** 2.4
+
+# WCAG sRGB -> linear light for every 8-bit channel value.
+SRGB_TO_LINEAR = tuple(_srgb_channel_to_linear(i / 255) for i in range(256))
+
+FRAME_SIZE = 64 * 64 * 3
+# Bump when a pipeline change alters processed frames, so persisted cache entries are not reused.
+PIPELINE_VERSION = 3
+STAGE_CACHE_SIZE = 50
+CONTENT_INDEX_SIZE = 1000
+# Downloads stream in chunks; only the first part is parsed to read the image dimensions.
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+HEADER_PROBE_BYTES = 512 * 1024
+MAX_SOURCE_PIXELS = 6000 * 6000
+
+# Settings read by the image pipeline; process-pool workers get an immutable copy of just these.
+IMAGE_CONFIG_FIELDS = (
+    'crop_borders', 'crop_extra', 'special_mode', 'contrast', 'sharpness', 'colors', 'kernel', 'limit_color',
+    'burned', 'text_bg', 'top_text', 'show_text', 'clock_align', 'wled', 'force_font_color', 'color_engine',
+)
+ImageConfigSnapshot = namedtuple('ImageConfigSnapshot', IMAGE_CONFIG_FIELDS)
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pixoo64_cache")
+
 # --- HELPERS ---
 def split_string(text, length):
     words = text.split(' ')
@@ -173,7 +216,75 @@ def split_string(text, length):
     lines.append(current_line)
     return lines
 
+@lru_cache(maxsize=8)
+def threshold_table(threshold: float) -> tuple:
+    """Point table that maps 8-bit values above threshold to 255 and the rest to 0."""
+    return tuple(255 if p > threshold else 0 for p in range(256))
+
+AI_IMAGE_BASE_URL = "https://gen.pollinations.ai/image/"
+# Smallest request that still leaves headroom for cropping to 64x64; models not listed only render at 1024.
+AI_IMAGE_SIZES = {"flux": 512, "zimage": 512, "z-image": 512, "z-image-turbo": 512, "klein": 512, "klein-9b": 512, "klein-large": 512, "flux-klein": 512, "flux-klein-9b": 512}
+
+# HA artwork URLs carry access tokens that rotate while the image stays the same.
+HA_PROXY_PATH = re.compile(r'^/api/(media_player_proxy|image_proxy)/[^/?#]+$')
+HA_CONTENT_PARAMS = ('cache',)
+
+def canonical_picture_key(picture: str) -> Tuple[str, str]:
+    """
+    Stable cache key for an artwork URL and the name of the URL pattern it matched.
+    HA proxy URLs are keyed on their path plus the image's cache= hash (token dropped), signed
+    HA paths on the path without authSig, AI generation URLs without the API key; any other URL is used as-is.
+    """
+    parts = urllib.parse.urlsplit(picture)
+    query = urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+    names = {name for name, _ in query}
+    if picture.startswith(AI_IMAGE_BASE_URL):
+        stable = [(name, value) for name, value in query if name != 'key']
+        return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(stable))), "ai_generated"
+    proxy = HA_PROXY_PATH.match(parts.path)
+    if proxy and names.intersection(HA_CONTENT_PARAMS):
+        stable = [(name, value) for name, value in query if name in HA_CONTENT_PARAMS]
+        return f"{parts.path}?{urllib.parse.urlencode(sorted(stable))}", f"ha_{proxy.group(1)}"
+    if proxy:
+        # Without a content hash the token is all that tells two images of this entity apart.
+        return picture, f"ha_{proxy.group(1)}_uncached"
+    if 'authSig' in names:
+        stable = [(name, value) for name, value in query if name != 'authSig']
+        return parts.path + (f"?{urllib.parse.urlencode(stable)}" if stable else ""), "ha_signed_path"
+    if parts.hostname:
+        return picture, parts.hostname
+    return picture, "other"
+
+# Last.fm labels its image sizes instead of giving dimensions.
+LASTFM_IMAGE_EDGES = {"small": 34, "medium": 64, "large": 174, "extralarge": 300, "mega": 600}
+# Slides are shown at 64x64 without cropping, so they need no headroom.
+SLIDE_IMAGE_EDGE = 64
+
+def select_image_variant(variants, min_edge: int) -> Optional[str]:
+    """
+    URL of the smallest variant whose shorter edge is at least min_edge, else of the largest variant.
+    `variants` holds (edge, url) pairs; variants without a URL or a known edge are ignored, and None
+    is returned when no variant is left so the caller can keep its provider-specific default.
+    """
+    sized = [(edge, url) for edge, url in variants if url and edge]
+    if not sized:
+        return None
+    large_enough = [variant for variant in sized if variant[0] >= min_edge]
+    if large_enough:
+        return min(large_enough, key=lambda variant: variant[0])[1]
+    return max(sized, key=lambda variant: variant[0])[1]
+
+def spotify_image_variants(images: list) -> list:
+    """(edge, url) pairs from a Spotify images array."""
+    return [(min(filter(None, (image.get('width'), image.get('height'))), default=0), image.get('url')) for image in images]
+
+def normalise_lookup_text(text: Optional[str]) -> str:
+    """Case- and punctuation-insensitive form of an artist, title or album name, used in lookup keys."""
+    return " ".join(re.sub(r"[^\w\s]", " ", (text or "").casefold()).split())
+
 def format_memory_size(size):
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.2f} MB"
     return f"{size / 1024:.2f} KB"
 
 def get_bidi(text):
@@ -193,12 +304,30 @@ def ensure_rgb(img):
     except (UnidentifiedImageError, OSError):
         return None
 
+def decode_image(image_data: bytes, target: int) -> Optional[Image.Image]:
+    """
+    Decode image bytes to RGB close to the size they will be used at.
+    JPEGs are scaled by the decoder (draft mode), other formats are box-reduced right after decoding.
+    The longest side never drops below target, so the caller's own resize still sets the final size.
+    """
+    img = Image.open(BytesIO(image_data))
+    longest = max(img.size)
+    if img.format == "JPEG" and longest >= 2 * target:
+        ratio = target / longest
+        img.draft("RGB", (max(1, math.ceil(img.width * ratio)), max(1, math.ceil(img.height * ratio))))
+    img.load()
+    img = ensure_rgb(img)
+    if img is not None:
+        factor = max(img.size) // target
+        if factor >= 2:
+            img = img.reduce(factor)
+    return img
+
 def _resize_image_sync(image_data: bytes) -> Optional[Image.Image]:
     try:
-        img = Image.open(BytesIO(image_data))
-        img.load() 
-        if img.mode != "RGB":
-            img = img.convert("RGB")
+        img = decode_image(image_data, 34)
+        if img is None:
+            return None
         img = img.resize((34, 34), Image.Resampling.BICUBIC)
         return img
     except Exception:
@@ -227,6 +356,10 @@ class Config:
             'discogs': None,
             'lastfm': ('last.fm', None),
             'pollinations': None,
+            'ai_cache': 200,
+            'fallback_hedge_delay': None,
+            'negative_cache_hours': 24,
+            'artwork_index_days': 30,
         },
         'pixoo': {
             'url': None,
@@ -243,6 +376,15 @@ class Config:
             'tv_icon_pic': ('tv_icon', False),
             'spotify_slide': False,
             'images_cache': 25,
+            'color_engine': 'auto',
+            'cache_memory_mb': None,
+            'frame_store': 0,
+            'cache_dir': None,
+            'max_download_mb': 10,
+            'artwork_min_edge': 240,
+            'max_command_rate': 10,
+            'image_executor': 'thread',
+            'image_workers': None,
             'limit_color': ('limit_colors', None),
             'show_lyrics': ('lyrics', False),
             'lyrics_font': 190,
@@ -311,6 +453,23 @@ class Config:
                 setattr(self, attr_name_in_class, user_data_for_this_section.get(yaml_key_in_user_data, default_value))
 
         self.images_cache = max(1, min(int(self.images_cache) if self.images_cache is not None else 1, 300))
+        if self.cache_memory_mb:
+            self.cache_memory_bytes = int(max(0.1, float(self.cache_memory_mb)) * 1024 * 1024)
+        else:
+            # Legacy count-based setting: budget roughly one frame plus its metadata per image.
+            self.cache_memory_bytes = self.images_cache * 16 * 1024
+        self.frame_store = max(0, int(self.frame_store)) if self.frame_store else 0
+        self.ai_cache = max(0, int(self.ai_cache)) if self.ai_cache else 0
+        self.artwork_min_edge = max(64, int(self.artwork_min_edge)) if self.artwork_min_edge else 64
+        self.max_command_rate = max(0.5, float(self.max_command_rate)) if self.max_command_rate else 10.0
+        self.cache_dir = self.cache_dir or DEFAULT_CACHE_DIR
+        self.max_download_bytes = int(max(0.1, float(self.max_download_mb)) * 1024 * 1024) if self.max_download_mb else 0
+        self.image_executor = str(self.image_executor).lower()
+        if self.fallback_hedge_delay is None or self.fallback_hedge_delay is False:
+            self.fallback_hedge_delay = None
+        else:
+            self.fallback_hedge_delay = max(0.0, float(self.fallback_hedge_delay))
+        self.image_workers = max(1, int(self.image_workers)) if self.image_workers else (os.cpu_count() or 1)
         self.sound_effect = max(0, min(int(self.sound_effect) if self.sound_effect is not None else 0, 3))
 
         self._fix_config_args(getattr(self, 'url', None))
@@ -332,12 +491,19 @@ class Config:
         self.original_burned = self.burned
         self.original_top = self.top_text
 
-    def _fix_config_args(self, pixoo_url_raw: Optional[str]):
-        if pixoo_url_raw:
-            pixoo_url = f"http://{pixoo_url_raw}" if not pixoo_url_raw.startswith('http') else pixoo_url_raw
-            self.pixoo_url: str = f"{pixoo_url}:80/post" if not pixoo_url.endswith(':80/post') else pixoo_url
-        else:
-            self.pixoo_url = None
+    def image_snapshot(self) -> ImageConfigSnapshot:
+        """Picklable, immutable copy of the settings the image pipeline reads."""
+        return ImageConfigSnapshot(*(getattr(self, field) for field in IMAGE_CONFIG_FIELDS))
+
+    def _fix_config_args(self, pixoo_url_raw: Any):
+        # `url` is one address or a list of them; all devices show the same picture.
+        self.pixoo_urls: list = []
+        for raw_url in (pixoo_url_raw if isinstance(pixoo_url_raw, (list, tuple)) else [pixoo_url_raw]):
+            if raw_url:
+                raw_url = str(raw_url).strip()
+                pixoo_url = f"http://{raw_url}" if not raw_url.startswith('http') else raw_url
+                self.pixoo_urls.append(f"{pixoo_url}:80/post" if not pixoo_url.endswith(':80/post') else pixoo_url)
+        self.pixoo_url: Optional[str] = self.pixoo_urls[0] if self.pixoo_urls else None
 
         if self.ai_fallback not in ["flux", "turbo"]:
             self.ai_fallback = "turbo"
@@ -357,12 +523,124 @@ class Config:
                 elif not current_color_val.startswith('#'):
                     self.force_font_color = None
 
+def pool_trace(stats: dict) -> aiohttp.TraceConfig:
+    """TraceConfig that records connection-pool use of a session into `stats`."""
+    stats.update({'active_requests': 0, 'connections_created': 0, 'connections_reused': 0, 'queued': 0, 'queue_wait_ms': 0.0})
+    trace = aiohttp.TraceConfig()
+
+    async def request_start(session, context, params):
+        stats['active_requests'] += 1
+
+    async def request_done(session, context, params):
+        stats['active_requests'] -= 1
+
+    async def queued_start(session, context, params):
+        context.queued_at = time.perf_counter()
+
+    async def queued_end(session, context, params):
+        stats['queued'] += 1
+        stats['queue_wait_ms'] = round(stats['queue_wait_ms'] + (time.perf_counter() - context.queued_at) * 1000, 1)
+
+    async def created(session, context, params):
+        stats['connections_created'] += 1
+
+    async def reused(session, context, params):
+        stats['connections_reused'] += 1
+
+    trace.on_request_start.append(request_start)
+    trace.on_request_end.append(request_done)
+    trace.on_request_exception.append(request_done)
+    trace.on_connection_queued_start.append(queued_start)
+    trace.on_connection_queued_end.append(queued_end)
+    trace.on_connection_create_end.append(created)
+    trace.on_connection_reuseconn.append(reused)
+    return trace
+
+class PixooPacer:
+    """AIMD pacing for Pixoo commands, driven by measured round-trip times and failures.
+
+    The send rate (commands per second; the gap between commands is its inverse) starts at, and
+    never exceeds, `max_rate`. It is halved on every failed attempt (error status, connection error
+    or timeout) and grows back by RATE_STEP per acknowledged command. The default cap of 10/s is the
+    fixed 100 ms pacing used before; the Pixoo is known to lock up when flooded, so the pacer only
+    backs off from it. The request timeout follows the smoothed round-trip time like a TCP
+    retransmission timer: srtt + 4 * rttvar, clamped to [MIN_TIMEOUT, MAX_TIMEOUT].
+    """
+
+    DEFAULT_MAX_RATE = 10.0
+    MIN_RATE = 0.5
+    RATE_STEP = 1.0
+    INITIAL_TIMEOUT = 5.0
+    MIN_TIMEOUT = 2.0
+    MAX_TIMEOUT = 15.0
+    WINDOW = 50
+
+    def __init__(self, max_rate: float = DEFAULT_MAX_RATE):
+        self.max_rate = max(self.MIN_RATE, float(max_rate))
+        self.rate = self.max_rate
+        self.timeout = self.INITIAL_TIMEOUT
+        self.srtt: Optional[float] = None
+        self.rttvar = 0.0
+        self._outcomes: deque = deque(maxlen=self.WINDOW)
+
+    @property
+    def gap(self) -> float:
+        return 1 / self.rate
+
+    def success(self, rtt: float):
+        if self.srtt is None:
+            self.srtt, self.rttvar = rtt, rtt / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+        self.timeout = min(self.MAX_TIMEOUT, max(self.MIN_TIMEOUT, self.srtt + 4 * self.rttvar))
+        self.rate = min(self.max_rate, self.rate + self.RATE_STEP)
+        self._outcomes.append(True)
+
+    def failure(self, timed_out: bool = False):
+        self.rate = max(self.MIN_RATE, self.rate / 2)
+        if timed_out:
+            self.timeout = min(self.MAX_TIMEOUT, self.timeout * 2)
+        self._outcomes.append(False)
+
+    @property
+    def error_rate(self) -> float:
+        return round(self._outcomes.count(False) / len(self._outcomes), 3) if self._outcomes else 0.0
+
+    def attributes(self) -> dict:
+        return {
+            "gap_ms": round(self.gap * 1000, 1),
+            "timeout_s": round(self.timeout, 2),
+            "rtt_ms": round(self.srtt * 1000, 1) if self.srtt is not None else None,
+            "error_rate": self.error_rate,
+        }
+
 class PixooDevice:
-    """Handles communication with the Divoom Pixoo device with retry logic.""" 
+    """Handles communication with the Divoom Pixoo device with retry logic.
+
+    The Pixoo copes badly with concurrent requests, so every command goes through a single writer
+    task that sends them one at a time in queue order. A command queued with a `kind` ("image",
+    "text" or "info") replaces a still-pending command of the same kind: only the newest frame,
+    text layer or info message is sent, which keeps the queue short. The gap between commands and
+    the request timeout are adapted to the device by a PixooPacer.
+
+    Untagged commands are kept in order; beyond MAX_QUEUED the oldest of them are dropped, so a
+    device that cannot keep up does not build an unbounded backlog.
 
-    def __init__(self, config: "Config", session: aiohttp.ClientSession): 
+    In a PixooGroup (`skip_when_down`), a device whose last FAILURE_THRESHOLD commands all failed
+    is considered down and commands to it are dropped for DOWN_COOLDOWN seconds; the first command
+    after that probes it again. A lone device keeps retrying every command.
+    """
+
+    FAILURE_THRESHOLD = 3
+    DOWN_COOLDOWN = 30
+    MAX_QUEUED = 32
+
+    def __init__(self, config: "Config", session: aiohttp.ClientSession, url: Optional[str] = None): 
         self.config = config
         self.session = session
+        self.url = url or config.pixoo_url
+        self.host = (urllib.parse.urlsplit(self.url).hostname if self.url else None) or "unknown"
         self.select_index: Optional[int] = None 
         self.headers = {
             "Content-Type": "application/json",
@@ -370,148 +648,987 @@ class PixooDevice:
             "Connection": "keep-alive",
             "User-Agent": "PixooClient/1.0"
         }
-        self._last_payload_str: Optional[str] = None
+        self._last_digest: Optional[bytes] = None
         self._last_send_time: float = 0.0
+        self._queue: deque = deque()
+        self._pending: Dict[str, tuple] = {}
+        self._writer: Optional[asyncio.Task] = None
+        self.queue_stats = {'sent': 0, 'superseded': 0, 'dropped': 0, 'skipped': 0, 'max_wait_ms': 0.0}
+        self.pacer = PixooPacer(config.max_command_rate)
+        self.skip_when_down = False
+        self._failed_commands = 0
+        self._down_until = 0.0
+
+    async def send_command(self, payload_command: dict, retries: int = 3, kind: Optional[str] = None) -> None: 
+        """
+        Queues a command and waits until it has been sent (with automatic retries on failure),
+        or until a newer command of the same `kind` replaced it.
+        """
+        if self.session.closed:
+            return
+
+        # Serialised once: the bytes are both the dedup digest input and the request body.
+        body = self.encode_payload(payload_command)
+        await self.send_encoded(body, hashlib.blake2b(body, digest_size=16).digest(), retries, kind)
 
-    async def send_command(self, payload_command: dict, retries: int = 3) -> None: 
-        """Sends a command with automatic retries on failure."""
+    async def send_encoded(self, body: bytes, digest: bytes, retries: int = 3, kind: Optional[str] = None) -> None:
+        """send_command for a payload already encoded with encode_payload; `digest` identifies it for dedup."""
         if self.session.closed:
             return
+        now = time.monotonic()
+        if digest == self._last_digest and now - self._last_send_time < 1.0:
+            return
+        if now < self._down_until:
+            self.queue_stats['skipped'] += 1
+            return
+        self._last_digest = digest
+        self._last_send_time = now
+
+        await self._submit(body, retries, kind)
+
+    @staticmethod
+    def encode_payload(payload_command: dict) -> bytes:
+        return json.dumps(payload_command, separators=(",", ":")).encode("utf-8")
 
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def status(self) -> dict:
+        return {'available': self.available, **self.queue_stats, 'pacing': self.pacer.attributes()}
+
+    async def _submit(self, body: bytes, retries: int, kind: Optional[str], want_response: bool = False) -> Optional[dict]:
+        future = asyncio.get_running_loop().create_future()
+        entry = (kind, body, retries, want_response, future, time.perf_counter())
+        if kind is not None:
+            superseded = self._pending.pop(kind, None)
+            if superseded is not None:
+                self._queue.remove(superseded)
+                if not superseded[4].done():
+                    superseded[4].set_result(None)
+                self.queue_stats['superseded'] += 1
+            self._pending[kind] = entry
+        self._queue.append(entry)
+        if kind is None and len(self._queue) > self.MAX_QUEUED:
+            oldest = next(queued for queued in self._queue if queued[0] is None)
+            self._queue.remove(oldest)
+            if not oldest[4].done():
+                oldest[4].set_result(None)
+            self.queue_stats['dropped'] += 1
+        if self._writer is None:
+            self._writer = asyncio.ensure_future(self._write_queue())
+        # A cancelled caller cancels its future; the writer skips it if it is still queued.
+        return await future
+
+    async def _write_queue(self) -> None:
         try:
-            current_payload_str = json.dumps(payload_command, sort_keys=True)
-            now = time.monotonic()
-            if (current_payload_str == self._last_payload_str) and (now - self._last_send_time < 1.0):
-                return
-            self._last_payload_str = current_payload_str
-            self._last_send_time = now
-        except Exception:
-            pass 
+            while self._queue:
+                entry = self._queue.popleft()
+                kind, body, retries, want_response, future, queued_at = entry
+                if kind is not None and self._pending.get(kind) is entry:
+                    del self._pending[kind]
+                if future.done():
+                    continue
+                if not self.available:
+                    self.queue_stats['skipped'] += 1
+                    future.set_result(None)
+                    continue
+                wait_ms = (time.perf_counter() - queued_at) * 1000
+                self.queue_stats['max_wait_ms'] = round(max(self.queue_stats['max_wait_ms'], wait_ms), 1)
+                result = await self._post(body, retries, want_response)
+                self.queue_stats['sent'] += 1
+                if not future.done():
+                    future.set_result(result)
+                await asyncio.sleep(self.pacer.gap)
+        finally:
+            self._writer = None
 
+    async def _post(self, body: bytes, retries: int, want_response: bool) -> Optional[dict]:
         for attempt in range(1, retries + 1):
+            if self.session.closed:
+                return None
+            start = time.perf_counter()
             try:
                 async with self.session.post(
-                    self.config.pixoo_url,
+                    self.url,
                     headers=self.headers,
-                    json=payload_command,
-                    timeout=aiohttp.ClientTimeout(total=5)
+                    data=body,
+                    timeout=aiohttp.ClientTimeout(total=self.pacer.timeout)
                 ) as response:
                     if response.status == 200:
-                        await asyncio.sleep(0.1)
-                        return
+                        text = await response.text()
+                        self.pacer.success(time.perf_counter() - start)
+                        self._failed_commands = 0
+                        return json.loads(text) if want_response else None
                     else:
+                        self.pacer.failure()
                         _LOGGER.warning(f"Pixoo command failed (Attempt {attempt}/{retries}). Status: {response.status}") 
             
             except (aiohttp.ClientError, asyncio.TimeoutError) as e: 
+                self.pacer.failure(timed_out=isinstance(e, asyncio.TimeoutError))
                 if attempt == retries:
-                    _LOGGER.error(f"Failed to send command to Pixoo after {retries} attempts: {e}")
-                else:
-                    await asyncio.sleep(0.2 * attempt)
+                    _LOGGER.error(f"Failed to send command to Pixoo {self.host} after {retries} attempts: {e}")
             
             except Exception as e:
                 if "Session is closed" not in str(e):
                     _LOGGER.exception(f"Unexpected error sending to Pixoo: {e}")
-                return
+                return None
+
+            # Both error statuses and exceptions back off before the next attempt.
+            if attempt < retries:
+                await asyncio.sleep(self.pacer.gap * attempt)
+
+        self._failed_commands += 1
+        if self.skip_when_down and self._failed_commands >= self.FAILURE_THRESHOLD:
+            if self.available:
+                _LOGGER.warning(f"Pixoo {self.host} is not responding; skipping it for {self.DOWN_COOLDOWN}s.")
+            self._down_until = time.monotonic() + self.DOWN_COOLDOWN
+        return None
 
     async def get_current_channel_index(self) -> int: 
         if self.session.closed: return 0
         
         channel_command = { "Command": "Channel/GetIndex" }
         try:
-            async with self.session.post(
-                self.config.pixoo_url,
-                headers=self.headers,
-                json=channel_command,
-                timeout=aiohttp.ClientTimeout(total=5)
-            ) as response:
-                response.raise_for_status() 
-                response_text = await response.text()
-                response_data = json.loads(response_text)
-                return response_data.get('SelectIndex', 0)
+            response_data = await self._submit(self.encode_payload(channel_command), 1, None, want_response=True)
+            return response_data.get('SelectIndex', 0) if isinstance(response_data, dict) else 0
         except Exception: 
             return 0
 
+class PixooGroup:
+    """Several Pixoo64s showing the same picture, driven like one PixooDevice.
+
+    A command is encoded once and queued on every device; each device keeps its own writer queue,
+    pacing and health. Callers wait only for the fastest device, the others catch up in the
+    background in the same order, so a slow or unreachable panel does not hold up the rest. The
+    current channel is read from the first available device and applied to all of them.
+    """
+
+    def __init__(self, devices: list):
+        self.devices = devices
+        self._background: set = set()
+        for device in devices:
+            device.skip_when_down = True
+
+    async def send_command(self, payload_command: dict, retries: int = 3, kind: Optional[str] = None) -> None:
+        body = PixooDevice.encode_payload(payload_command)
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        available = [device.available for device in self.devices]
+        sends = [asyncio.ensure_future(device.send_encoded(body, digest, retries, kind)) for device in self.devices]
+        for send in sends:
+            self._background.add(send)
+            send.add_done_callback(self._background.discard)
+        # A device that is down returns at once, so it must not count as the fastest one.
+        waited = [send for send, up in zip(sends, available) if up] or sends
+        try:
+            await asyncio.wait(waited, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            for send in sends:
+                send.cancel()
+            raise
+
+    async def get_current_channel_index(self) -> int:
+        device = next((device for device in self.devices if device.available), self.devices[0])
+        return await device.get_current_channel_index()
+
+def _deep_sizeof(value: Any) -> int:
+    size = sys.getsizeof(value)
+    if isinstance(value, tuple):
+        size += sum(sys.getsizeof(v) for v in value)
+    return size
+
+class CachedFrame:
+    """Compact in-memory cache entry: raw RGB pixels plus the colour metadata of a processed frame."""
+
+    META_FIELDS = (
+        'font_color', 'clock_color', 'temp_color', 'brightness', 'brightness_lower_part',
+        'background_color', 'background_color_rgb', 'most_common_color_alternative_rgb',
+        'most_common_color_alternative', 'color1', 'color2', 'color3',
+    )
+    __slots__ = ('pixels', 'size') + META_FIELDS
+
+    # Estimated OrderedDict bookkeeping per entry (hash table slot + linked-list node).
+    ENTRY_OVERHEAD = 104
+
+    def __init__(self, pixels: bytes, size: Tuple[int, int], meta: dict):
+        self.pixels = pixels
+        self.size = size
+        for field in self.META_FIELDS:
+            setattr(self, field, meta.get(field))
+
+    @classmethod
+    def from_processed(cls, data: dict) -> "CachedFrame":
+        img = ensure_rgb(data['pil_image'])
+        return cls(img.tobytes(), img.size, data)
+
+    def metadata(self) -> dict:
+        return {field: getattr(self, field) for field in self.META_FIELDS}
+
+    def nbytes(self, key: str) -> int:
+        """
+        Approximate heap footprint of this entry: measured object sizes of the key, pixels and
+        metadata plus the estimated ENTRY_OVERHEAD.
+        """
+        return (sys.getsizeof(self) + sys.getsizeof(key) + self.ENTRY_OVERHEAD + _deep_sizeof(self.pixels)
+                + _deep_sizeof(self.size) + sum(_deep_sizeof(getattr(self, f)) for f in self.META_FIELDS))
+
+class VectorColorEngine:
+    """
+    NumPy implementation of the colour scoring used by ImageProcessor.img_values and of the
+    border scan used when cropping. Scores every candidate at once with the same float operations
+    as the Python loops, so it makes the same choices (including tie-breaking) while avoiding
+    per-pixel Python work.
+    """
+
+    def __init__(self):
+        self._linear = np.array(SRGB_TO_LINEAR)
+        # math.log rather than np.log keeps the vibrancy scores bit-identical to the Python path.
+        self._log = np.array([0.0] + [math.log(i) for i in range(1, 64 * 64 + 1)])
+
+    @staticmethod
+    def _sat_val(rgb: "np.ndarray") -> tuple:
+        maxc = rgb.max(axis=1) / 255.0
+        minc = rgb.min(axis=1) / 255.0
+        sat = np.zeros_like(maxc)
+        np.divide(maxc - minc, maxc, out=sat, where=maxc > 0)
+        return sat, maxc
+
+    def vibrant_palette(self, raw_colors: list) -> list:
+        if not raw_colors:
+            return []
+        sat, val = self._sat_val(np.array(raw_colors, dtype=np.int64))
+        keep = (sat > 0.2) & (val > 0.15)
+        return [rgb for rgb, k in zip(raw_colors, keep.tolist()) if k]
+
+    @staticmethod
+    def mean_rgb(img: Image.Image, box: Optional[tuple] = None, pixels: Optional["np.ndarray"] = None) -> tuple:
+        """Same value as ImageStat.Stat(img.crop(box)).mean[:3]: exact integer sums divided by the pixel count."""
+        if pixels is None:
+            pixels = np.asarray(img)
+        if box is not None:
+            left, top, right, bottom = box
+            if left < 0 or top < 0 or right > pixels.shape[1] or bottom > pixels.shape[0]:
+                return tuple(ImageStat.Stat(img.crop(box)).mean[:3])
+            pixels = pixels[top:bottom, left:right]
+        count = pixels.shape[0] * pixels.shape[1]
+        sums = pixels.reshape(-1, pixels.shape[-1])[:, :3].sum(axis=0, dtype=np.int64)
+        return tuple(int(v) / count for v in sums)
+
+    def best_colors_for_zones(self, img: Image.Image, boxes: tuple, candidates: list) -> list:
+        rgb = np.array(candidates, dtype=np.int64).reshape(-1, 3)
+        r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+        text_lum = (0.2126 * r + 0.7152 * g + 0.0722 * b) / 255.0
+        sat, val = self._sat_val(rgb)
+        base_score = sat * 5.0
+
+        pixels = np.asarray(img) if img.mode == "RGB" else None
+        results = []
+        for box in boxes:
+            try:
+                zr, zg, zb = self.mean_rgb(img, box, pixels) if pixels is not None else ImageStat.Stat(img.crop(box)).mean[:3]
+                bg_lum = (0.2126 * zr + 0.7152 * zg + 0.0722 * zb) / 255.0
+            except Exception:
+                bg_lum = 0.5
+            is_bg_dark = bg_lum < 0.5
+
+            contrast = (np.maximum(text_lum, bg_lum) + 0.05) / (np.minimum(text_lum, bg_lum) + 0.05)
+            score = contrast * 2.0 + base_score
+            if is_bg_dark:
+                score = np.where(text_lum < 0.3, score + val * 3.0 - 20, score + val * 3.0)
+            else:
+                score = np.where(text_lum > 0.7, score + (1.0 - val) * 3.0 - 20, score + (1.0 - val) * 3.0)
+
+            best_color = None
+            if len(candidates):
+                idx = int(np.argmax(score))
+                if score[idx] > -100:
+                    best_color = candidates[idx]
+            if not best_color:
+                best_color = (0, 255, 255) if is_bg_dark else (0, 0, 255)
+            results.append(f'#{best_color[0]:02x}{best_color[1]:02x}{best_color[2]:02x}')
+        return results
+
+    def dominant_color(self, colors_raw: list) -> Optional[tuple]:
+        if not colors_raw:
+            return None
+        counts = np.array([count for count, _ in colors_raw], dtype=np.int64)
+        rgb = np.array([color[:3] for _, color in colors_raw], dtype=np.int64)
+        sat, val = self._sat_val(rgb)
+
+        vibrancy = (sat * val * val) * (self._log[np.minimum(counts, len(self._log) - 1)] + 1)
+        order = np.argsort(-vibrancy, kind="stable")
+        ok = ((sat > 0.15) & (val > 0.15) & (val < 0.95))[order]
+        if ok.any():
+            return tuple(colors_raw[order[int(np.argmax(ok))]][1][:3])
+
+        order = np.argsort(-counts, kind="stable")
+        bright = (rgb.sum(axis=1) > 50)[order]
+        if bright.any():
+            return tuple(colors_raw[order[int(np.argmax(bright))]][1][:3])
+        return None
+
+    def best_font_color(self, candidates: list, avg_bg: tuple, dominant: Optional[tuple]) -> Optional[tuple]:
+        rgb = np.array(candidates, dtype=np.int64)
+        lin = self._linear[rgb]
+        lum = 0.2126 * lin[:, 0] + 0.7152 * lin[:, 1] + 0.0722 * lin[:, 2] + 0.05
+        bg = self._linear[np.array(avg_bg[:3], dtype=np.int64)]
+        bg_lum = 0.2126 * bg[0] + 0.7152 * bg[1] + 0.0722 * bg[2] + 0.05
+        contrast = np.maximum(lum, bg_lum) / np.minimum(lum, bg_lum)
+
+        sat, _ = self._sat_val(rgb)
+        threshold = np.where(sat < 0.1, 4.0, 2.2)
+        score = contrast + sat * 25.0
+        if dominant:
+            dist_sq = ((rgb - np.array(dominant, dtype=np.int64)) ** 2).sum(axis=1)
+            score = np.where(dist_sq < 900, score + 5.0, score)
+        score = np.where(contrast < threshold, -np.inf, score)
+
+        idx = int(np.argmax(score))
+        return candidates[idx] if score[idx] > -100 else None
+
+    @staticmethod
+    def border_rows(window: Image.Image, border_color: tuple, thresh: float) -> tuple:
+        """Leading and trailing runs of rows whose pixels all lie within thresh of border_color."""
+        pixels = np.asarray(window, dtype=np.int32)
+        dist_sq = ((pixels - np.array(border_color[:3], dtype=np.int32)) ** 2).sum(axis=2)
+        content_rows = np.flatnonzero((dist_sq > thresh * thresh).any(axis=1))
+        if content_rows.size == 0:
+            return window.height, window.height
+        return int(content_rows[0]), window.height - 1 - int(content_rows[-1])
+
+class FrameStore:
+    """Persistent LRU store of processed 64x64 RGB frames in a single memory-mapped file.
+
+    Every fixed-size slot of `frames.bin` starts with a record (hashed cache key, CRC, last-use
+    tick and the colour metadata of the frame) followed by the pixels. A put or a hit only writes
+    its own slot, so there is no index file to rewrite; the index is rebuilt by scanning the
+    records on start.
+    """
+
+    VERSION = 2
+    MAGIC = b"PXFS"
+    # magic, last-use tick, version, key digest, CRC of metadata + pixels, metadata length.
+    HEADER = struct.Struct("<4sQH16sIH")
+    TICK = struct.Struct("<Q")
+    TICK_OFFSET = 4
+    RECORD_SIZE = 1024
+    SLOT_SIZE = RECORD_SIZE + FRAME_SIZE
+
+    def __init__(self, path: str, slots: int):
+        self.slots = slots
+        self._data_path = os.path.join(path, "frames.bin")
+        self._index: OrderedDict[bytes, list] = OrderedDict()
+        self._free: list[int] = []
+        self._tick = 0
+
+        os.makedirs(path, exist_ok=True)
+        try:
+            # Whole-file JSON index of the previous layout; its frames.bin is rejected below.
+            os.remove(os.path.join(path, "frames.idx"))
+        except FileNotFoundError:
+            pass
+        mode = "r+b" if os.path.exists(self._data_path) else "w+b"
+        self._file = open(self._data_path, mode)
+        if os.fstat(self._file.fileno()).st_size != slots * self.SLOT_SIZE:
+            self._file.truncate(slots * self.SLOT_SIZE)
+        self._mmap = mmap.mmap(self._file.fileno(), slots * self.SLOT_SIZE)
+        self._load_records()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def used_bytes(self) -> int:
+        return len(self._index) * self.SLOT_SIZE
+
+    @staticmethod
+    def _digest(key: str) -> bytes:
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+    def _load_records(self):
+        found: Dict[bytes, tuple] = {}
+        for slot in range(self.slots):
+            start = slot * self.SLOT_SIZE
+            magic, tick, version, digest, crc, meta_len = self.HEADER.unpack_from(self._mmap, start)
+            if magic != self.MAGIC or version != self.VERSION or meta_len > self.RECORD_SIZE - self.HEADER.size:
+                continue
+            meta_bytes = self._mmap[start + self.HEADER.size:start + self.HEADER.size + meta_len]
+            pixels = self._mmap[start + self.RECORD_SIZE:start + self.SLOT_SIZE]
+            if zlib.crc32(pixels, zlib.crc32(meta_bytes)) != crc:
+                # Torn write (e.g. unclean shutdown while the slot was being replaced).
+                continue
+            try:
+                meta = {k: tuple(v) if isinstance(v, list) else v for k, v in json.loads(meta_bytes).items()}
+            except (ValueError, AttributeError):
+                continue
+            if digest not in found or found[digest][0] < tick:
+                found[digest] = (tick, slot, meta)
+
+        for digest, (tick, slot, meta) in sorted(found.items(), key=lambda item: item[1][0]):
+            self._index[digest] = [slot, meta]
+            self._tick = max(self._tick, tick)
+        used = {slot for slot, _ in self._index.values()}
+        self._free = [slot for slot in range(self.slots - 1, -1, -1) if slot not in used]
+
+    def _touch(self, slot: int):
+        self._tick += 1
+        self.TICK.pack_into(self._mmap, slot * self.SLOT_SIZE + self.TICK_OFFSET, self._tick)
+
+    def get(self, key: str) -> Optional[Tuple[memoryview, dict]]:
+        """Returns a zero-copy view of the stored pixels and the frame metadata."""
+        digest = self._digest(key)
+        entry = self._index.get(digest)
+        if entry is None:
+            return None
+        slot, meta = entry
+        self._touch(slot)
+        self._index.move_to_end(digest)
+        start = slot * self.SLOT_SIZE + self.RECORD_SIZE
+        return memoryview(self._mmap)[start:start + FRAME_SIZE], meta
+
+    def put(self, key: str, pixels: bytes, meta: dict) -> bool:
+        """Stores a frame; returns False when it does not fit a slot (wrong size or oversized metadata)."""
+        if len(pixels) != FRAME_SIZE or self.slots < 1:
+            return False
+        try:
+            meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+        except (TypeError, ValueError):
+            return False
+        if len(meta_bytes) > self.RECORD_SIZE - self.HEADER.size:
+            return False
+        digest = self._digest(key)
+        if digest in self._index:
+            slot = self._index.pop(digest)[0]
+        elif self._free:
+            slot = self._free.pop()
+        else:
+            _, (slot, _) = self._index.popitem(last=False)
+        start = slot * self.SLOT_SIZE
+        # Body first, header last: a write cut short leaves a record whose CRC does not match.
+        self._mmap[start + self.HEADER.size:start + self.HEADER.size + len(meta_bytes)] = meta_bytes
+        self._mmap[start + self.RECORD_SIZE:start + self.SLOT_SIZE] = pixels
+        self._tick += 1
+        crc = zlib.crc32(pixels, zlib.crc32(meta_bytes))
+        self.HEADER.pack_into(self._mmap, start, self.MAGIC, self._tick, self.VERSION, digest, crc, len(meta_bytes))
+        self._index[digest] = [slot, meta]
+        return True
+
+    def clear(self):
+        for slot, _ in self._index.values():
+            self._mmap[slot * self.SLOT_SIZE:slot * self.SLOT_SIZE + len(self.MAGIC)] = bytes(len(self.MAGIC))
+        self._index.clear()
+        self._free = list(range(self.slots - 1, -1, -1))
+
+    def close(self):
+        if self._mmap.closed:
+            return
+        try:
+            self._mmap.flush()
+        except OSError as e:
+            _LOGGER.warning(f"Failed to flush frame store: {e}")
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # A frame view is still alive; the mapping is released with it.
+        self._file.close()
+
+class GeneratedArtStore:
+    """Persistent store of AI-generated source images, one file per hashed URL key.
+
+    Generated covers are slow and cost quota to recreate, so the source bytes are kept rather than
+    only the processed frame. Files are evicted oldest-used first beyond `max_entries`.
+    """
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._write_lock = threading.Lock()
+        self.hits = 0
+        os.makedirs(path, exist_ok=True)
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest() + ".img")
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._file(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            _LOGGER.warning(f"Failed to read generated artwork {path}: {e}")
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes):
+        path = self._file(key)
+        with self._write_lock:
+            try:
+                with open(path + ".tmp", "wb") as f:
+                    f.write(data)
+                os.replace(path + ".tmp", path)
+                stored = sorted(
+                    (entry for entry in os.scandir(self.path) if entry.name.endswith(".img")),
+                    key=lambda entry: entry.stat().st_mtime,
+                )
+                for entry in stored[:max(0, len(stored) - self.max_entries)]:
+                    os.remove(entry.path)
+            except OSError as e:
+                _LOGGER.warning(f"Failed to store generated artwork: {e}")
+
+class NegativeCache:
+    """Persistent record of artwork lookups that found nothing, per provider and normalised artist/title.
+
+    Entries expire after `ttl` seconds. The file stores a digest of each provider's credentials;
+    a provider's entries are dropped when its credentials change.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, ttl: float, credentials: Dict[str, Any]):
+        self.path = path
+        self.ttl = ttl
+        self._credentials = {
+            provider: hashlib.blake2b(repr(value).encode("utf-8"), digest_size=8).hexdigest()
+            for provider, value in credentials.items()
+        }
+        self._entries: Dict[str, float] = {}
+        self._write_lock = threading.Lock()
+        self.hits = 0
+        self._load()
+
+    @staticmethod
+    def _key(provider: str, artist: Optional[str], title: Optional[str]) -> str:
+        return f"{provider}|{normalise_lookup_text(artist)}|{normalise_lookup_text(title)}"
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self.VERSION:
+                return
+            saved = data.get("credentials", {})
+            stale = {provider for provider, digest in self._credentials.items() if saved.get(provider) != digest}
+            now = time.time()
+            self._entries = {
+                key: expires for key, expires in data.get("entries", {}).items()
+                if expires > now and key.split("|", 1)[0] in self._credentials and key.split("|", 1)[0] not in stale
+            }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            _LOGGER.warning(f"Negative lookup cache is unreadable, starting empty: {e}")
+            self._entries = {}
+
+    def is_miss(self, provider: str, artist: Optional[str], title: Optional[str]) -> bool:
+        key = self._key(provider, artist, title)
+        expires = self._entries.get(key)
+        if expires is None:
+            return False
+        if expires <= time.time():
+            del self._entries[key]
+            return False
+        self.hits += 1
+        return True
+
+    def record_miss(self, provider: str, artist: Optional[str], title: Optional[str]):
+        self._entries[self._key(provider, artist, title)] = time.time() + self.ttl
+
+    def snapshot(self) -> dict:
+        """Captures the live entries. Call from the event loop; write it with `write`."""
+        now = time.time()
+        return {
+            "version": self.VERSION,
+            "credentials": self._credentials,
+            "entries": {key: expires for key, expires in self._entries.items() if expires > now},
+        }
+
+    def write(self, snapshot: dict):
+        with self._write_lock:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = self.path + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(snapshot, f, separators=(",", ":"))
+                os.replace(tmp_path, self.path)
+            except (OSError, ValueError) as e:
+                _LOGGER.warning(f"Failed to write negative lookup cache: {e}")
+
+class ArtworkIndex:
+    """Persistent SQLite map from normalised (artist, title, album) to the artwork URL and source it resolved to.
+
+    Entries not confirmed for `ttl` seconds are still returned, flagged as stale so the caller can
+    revalidate them. The index is emptied when the set of configured providers changes, since a
+    different provider may then win. Methods block on disk; run them in an executor.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, path: str, ttl: float, providers: list):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        profile = f"{self.SCHEMA_VERSION}|{','.join(sorted(providers))}"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            row = conn.execute("SELECT value FROM meta WHERE name = 'profile'").fetchone()
+            if row is None or row[0] != profile:
+                conn.execute("DROP TABLE IF EXISTS artwork")
+                conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('profile', ?)", (profile,))
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS artwork (key TEXT PRIMARY KEY, url TEXT NOT NULL, source TEXT NOT NULL, "
+                "resolved_at REAL NOT NULL, checked_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        except sqlite3.Error as e:
+            _LOGGER.warning(f"Artwork index is unavailable: {e}")
+
+    @staticmethod
+    def _key(artist: Optional[str], title: Optional[str], album: Optional[str]) -> str:
+        return f"{normalise_lookup_text(artist)}|{normalise_lookup_text(title)}|{normalise_lookup_text(album)}"
+
+    def _execute(self, sql: str, params: tuple) -> list:
+        if self._conn is None:
+            return []
+        with self._lock:
+            try:
+                return self._conn.execute(sql, params).fetchall()
+            except sqlite3.Error as e:
+                _LOGGER.warning(f"Artwork index query failed: {e}")
+                return []
+
+    def lookup(self, artist: Optional[str], title: Optional[str], album: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+        """(url, source, stale) for a previously resolved track, or None."""
+        rows = self._execute("SELECT url, source, checked_at FROM artwork WHERE key = ?", (self._key(artist, title, album),))
+        if not rows:
+            return None
+        url, source, checked_at = rows[0]
+        self.hits += 1
+        return url, source, time.time() - checked_at > self.ttl
+
+    def store(self, artist: Optional[str], title: Optional[str], album: Optional[str], url: str, source: str):
+        now = time.time()
+        self._execute(
+            "INSERT OR REPLACE INTO artwork (key, url, source, resolved_at, checked_at) VALUES (?, ?, ?, ?, ?)",
+            (self._key(artist, title, album), url, source, now, now),
+        )
+
+    def confirm(self, artist: Optional[str], title: Optional[str], album: Optional[str]):
+        self._execute("UPDATE artwork SET checked_at = ? WHERE key = ?", (time.time(), self._key(artist, title, album)))
+
+    def forget(self, artist: Optional[str], title: Optional[str], album: Optional[str]):
+        self._execute("DELETE FROM artwork WHERE key = ?", (self._key(artist, title, album),))
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+class ProviderScoreboard:
+    """Rolling latency and hit-rate record per artwork provider, with a circuit breaker.
+
+    Providers are ordered by hit rate, then latency; each gets a timeout derived from its recent
+    latencies, never longer than its cold timeout (used until MIN_SAMPLES lookups have answered).
+    After FAILURE_THRESHOLD errors in a row a provider is skipped for a cooldown that
+    doubles on every trip; the first call after the cooldown decides whether it stays closed.
+    """
+
+    WINDOW = 20
+    FAILURE_THRESHOLD = 3
+    BASE_COOLDOWN = 60
+    MAX_COOLDOWN = 900
+    MIN_SAMPLES = 5
+    MIN_TIMEOUT = 3.0
+    COLD_TIMEOUT = 10.0
+
+    def __init__(self, cold_timeouts: Optional[Dict[str, float]] = None):
+        self._providers: Dict[str, dict] = {}
+        self._cold_timeouts = cold_timeouts or {}
+
+    def _entry(self, provider: str) -> dict:
+        return self._providers.setdefault(provider, {'samples': deque(maxlen=self.WINDOW), 'failures': 0, 'trips': 0, 'open_until': 0.0})
+
+    def record(self, provider: str, outcome: str, latency: float):
+        """outcome is 'hit', 'miss' (answered, no artwork) or 'error'."""
+        entry = self._entry(provider)
+        entry['samples'].append((outcome, latency))
+        if outcome != 'error':
+            entry['failures'] = 0
+            entry['trips'] = 0
+            return
+        entry['failures'] += 1
+        if entry['failures'] >= self.FAILURE_THRESHOLD:
+            cooldown = min(self.MAX_COOLDOWN, self.BASE_COOLDOWN * 2 ** entry['trips'])
+            entry['trips'] += 1
+            entry['open_until'] = time.time() + cooldown
+            # One more error after the cooldown re-opens the breaker straight away.
+            entry['failures'] = self.FAILURE_THRESHOLD - 1
+            _LOGGER.warning(f"{provider} keeps failing; skipping it for {cooldown}s.")
+
+    def available(self, provider: str) -> bool:
+        return time.time() >= self._entry(provider)['open_until']
+
+    def hit_rate(self, provider: str) -> Optional[float]:
+        samples = self._entry(provider)['samples']
+        return sum(1 for outcome, _ in samples if outcome == 'hit') / len(samples) if samples else None
+
+    def latency(self, provider: str) -> Optional[float]:
+        latencies = [latency for outcome, latency in self._entry(provider)['samples'] if outcome != 'error']
+        return sum(latencies) / len(latencies) if latencies else None
+
+    def timeout(self, provider: str) -> float:
+        cold = self._cold_timeouts.get(provider, self.COLD_TIMEOUT)
+        latencies = sorted(latency for outcome, latency in self._entry(provider)['samples'] if outcome != 'error')
+        if len(latencies) < self.MIN_SAMPLES:
+            return cold
+        p90 = latencies[min(len(latencies) - 1, math.ceil(0.9 * len(latencies)) - 1)]
+        return min(cold, max(self.MIN_TIMEOUT, p90 * 3))
+
+    def order(self, providers: list) -> list:
+        """Fast, reliable providers first; providers without history keep their configured position."""
+        def rank(provider):
+            rate = self.hit_rate(provider)
+            latency = self.latency(provider)
+            return (-round(rate if rate is not None else 0.5, 1), latency if latency is not None else self.timeout(provider) / 2)
+        return sorted(providers, key=rank)
+
+    def attributes(self) -> dict:
+        result = {}
+        for provider, entry in self._providers.items():
+            rate, latency = self.hit_rate(provider), self.latency(provider)
+            result[provider] = {
+                'hit_rate': round(rate, 2) if rate is not None else None,
+                'avg_latency_ms': round(latency * 1000) if latency is not None else None,
+                'timeout_s': round(self.timeout(provider), 1),
+                'lookups': len(entry['samples']),
+                'circuit': 'open' if not self.available(provider) else 'closed',
+            }
+        return result
+
 class ImageProcessor:
     """Processes images for display on the Pixoo64 device, including caching and filtering."""
 
     def __init__(self, config: "Config", session: aiohttp.ClientSession):
         self.config = config
         self.session = session
-        self.image_cache: OrderedDict[str, dict] = OrderedDict()
-        self.cache_size: int = config.images_cache
+        self.image_cache: OrderedDict[str, CachedFrame] = OrderedDict()
+        # Shared by image_cache (final frames) and the two stage caches; sizes are estimates, see _stage_nbytes.
+        self.cache_budget: int = config.cache_memory_bytes
         self._current_cache_memory: int = 0
         self._executor = ThreadPoolExecutor(max_workers=15, thread_name_prefix="PixooImageProc")
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        if config.image_executor == "process":
+            # spawn, not fork: forking a process that runs an event loop and thread pools is unsafe.
+            self._process_pool = ProcessPoolExecutor(max_workers=config.image_workers, mp_context=get_context("spawn"))
+        elif config.image_executor != "thread":
+            _LOGGER.warning(f"Unknown image_executor '{config.image_executor}'; using 'thread'.")
         self._default_font = ImageFont.load_default()
+        self._numpy_engine = self._select_engine(config.color_engine)
+        self._base_cache: OrderedDict[tuple, Image.Image] = OrderedDict()
+        self._filtered_cache: OrderedDict[tuple, dict] = OrderedDict()
+        self.download_stats: Dict[str, dict] = {}
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._waiters: Counter = Counter()
+        # Same bytes under another URL: content digest -> cache key holding the frame, and URL key -> that key.
+        self._content_index: OrderedDict[str, str] = OrderedDict()
+        self._url_aliases: OrderedDict[str, str] = OrderedDict()
+        self.content_dedup_hits = 0
+        self.url_pattern_stats: Dict[str, dict] = {}
+        self.coalesce_stats = {'started': 0, 'coalesced': 0}
+        self.frame_store: Optional[FrameStore] = None
+        if config.frame_store:
+            try:
+                self.frame_store = FrameStore(os.path.join(config.cache_dir, "frames"), config.frame_store)
+            except (OSError, ValueError) as e:
+                _LOGGER.warning(f"Persistent frame store disabled: {e}")
+        self.generated_store: Optional[GeneratedArtStore] = None
+        if config.ai_cache:
+            try:
+                self.generated_store = GeneratedArtStore(os.path.join(config.cache_dir, "generated"), config.ai_cache)
+            except OSError as e:
+                _LOGGER.warning(f"Generated artwork cache disabled: {e}")
+
+    @staticmethod
+    def _select_engine(color_engine: Any) -> Optional[VectorColorEngine]:
+        engine = str(color_engine).lower()
+        if engine in ("auto", "numpy") and numpy_support:
+            return VectorColorEngine()
+        if engine == "numpy":
+            _LOGGER.warning("color_engine 'numpy' requested but numpy is not installed; using the Python engine.")
+        return None
+
+    @property
+    def _vector_engine(self) -> Optional[VectorColorEngine]:
+        """
+        Engine for the colour analysis. "auto" keeps to the Python loops while text_background is on:
+        that path scores few candidates and NumPy is no faster there (benchmarks/color_engine.py).
+        """
+        if self._numpy_engine is not None and self.config.text_bg and str(self.config.color_engine).lower() == "auto":
+            return None
+        return self._numpy_engine
+
+    @classmethod
+    def for_worker(cls, snapshot: ImageConfigSnapshot) -> "ImageProcessor":
+        """Processor for process-pool workers: pipeline methods only, no session, caches or executors."""
+        processor = cls.__new__(cls)
+        processor.config = snapshot
+        processor._default_font = ImageFont.load_default()
+        processor._numpy_engine = cls._select_engine(snapshot.color_engine)
+        return processor
 
     def shutdown(self):
         self._executor.shutdown(wait=False)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+        if self.frame_store is not None:
+            self.frame_store.close()
         
     @property
     def _cache_size(self) -> int:
         return len(self.image_cache)
 
-    def _calculate_item_size(self, item: dict) -> int:
-        size = 0
-        if isinstance(item, dict):
-            for key, value in item.items():
-                if key == 'pil_image':
-                    size += 64 * 64 * 3
-                elif isinstance(value, str):
-                    size += len(value)
-                elif isinstance(value, (int, float, bool)):
-                    size += 8
-        return size
+    def _config_fingerprint(self) -> str:
+        """Digest of the settings that change the processed frame or its colour analysis."""
+        c = self.config
+        fields = (
+            PIPELINE_VERSION, c.crop_borders, c.crop_extra, c.special_mode,
+            c.contrast, c.sharpness, c.colors, c.kernel, c.limit_color,
+            c.burned, c.text_bg, c.top_text,
+            c.show_text, c.clock_align, bool(c.wled), c.force_font_color,
+        )
+        return hashlib.blake2b(repr(fields).encode("utf-8"), digest_size=8).hexdigest()
+
+    def _cache_get(self, cache_key: str) -> Optional[dict]:
+        if self.frame_store is not None:
+            stored = self.frame_store.get(cache_key)
+            if stored:
+                view, meta = stored
+                return {'frame': view, **meta}
+            # Frames that do not fit a store slot (small covers are not upscaled to 64x64)
+            # stay in the in-memory cache.
+
+        entry = self.image_cache.get(cache_key)
+        if entry is None:
+            return None
+        self.image_cache.move_to_end(cache_key)
+        return {'frame': entry.pixels, 'frame_size': entry.size, **entry.metadata()}
 
-    def _update_cache_memory_tracker(self, item: dict, add: bool = True):
-        size = self._calculate_item_size(item)
-        if add:
-            self._current_cache_memory += size
-        else:
-            self._current_cache_memory = max(0, self._current_cache_memory - size)
+    def _cache_put(self, cache_key: str, cached_data: dict):
+        entry = CachedFrame.from_processed(cached_data)
+        if self.frame_store is not None and entry.size == (64, 64):
+            if self.frame_store.put(cache_key, entry.pixels, entry.metadata()):
+                return
+
+        old_entry = self.image_cache.pop(cache_key, None)
+        if old_entry is not None:
+            self._current_cache_memory -= old_entry.nbytes(cache_key)
+
+        size = entry.nbytes(cache_key)
+        if size > self.cache_budget:
+            return
+        self._make_room(size)
+        self.image_cache[cache_key] = entry
+        self._current_cache_memory += size
+
+    def _make_room(self, size: int):
+        """
+        Evicts until `size` more bytes fit the budget: the oldest stage entries go first, since a
+        final frame hit skips every stage, then the oldest final frames.
+        """
+        for cache in (self._filtered_cache, self._base_cache):
+            while cache and self._current_cache_memory + size > self.cache_budget:
+                popped_key, popped = cache.popitem(last=False)
+                self._current_cache_memory -= self._stage_nbytes(popped_key, popped)
+        while self.image_cache and self._current_cache_memory + size > self.cache_budget:
+            popped_key, popped = self.image_cache.popitem(last=False)
+            self._current_cache_memory -= popped.nbytes(popped_key)
+
+    def _report_cache_usage(self, media_data: "MediaData"):
+        memory, count = self._current_cache_memory, self._cache_size
+        if self.frame_store is not None:
+            memory += self.frame_store.used_bytes
+            count += len(self.frame_store)
+        media_data.image_cache_memory = format_memory_size(memory)
+        media_data.image_cache_count = count
 
     async def get_image(self, picture: Optional[str], media_data: "MediaData", spotify_slide: bool = False) -> Optional[dict]:
         if not picture:
             return None
 
+        # Entries for different modes/crops live side by side, so switching modes never clears the cache.
+        picture_key, url_pattern = canonical_picture_key(picture)
+        cache_key = f"{picture_key}#{self._config_fingerprint()}"
         if self.config.burned:
-            cache_key = f"{picture}_{media_data.artist}_{media_data.title}"
-        else:
-            cache_key = picture
+            cache_key += f"_{media_data.artist}_{media_data.title}"
 
         use_cache = not spotify_slide and not media_data.playing_tv
-        cached_data = None
+        cached_data = self._cache_lookup(cache_key) if use_cache else None
+        if use_cache:
+            pattern_stats = self.url_pattern_stats.setdefault(url_pattern, {'hits': 0, 'misses': 0})
+            pattern_stats['hits' if cached_data else 'misses'] += 1
 
-        if use_cache and cache_key in self.image_cache:
-            self.image_cache.move_to_end(cache_key)
-            cached_data = self.image_cache[cache_key]
-            media_data.image_cache_memory = format_memory_size(self._current_cache_memory)
-            media_data.image_cache_count = self._cache_size
+        if cached_data:
+            self._report_cache_usage(media_data)
         else:
-            try:
-                url = picture if picture.startswith('http') else f"{self.config.ha_url}{picture}"
-                async with self.session.get(url, timeout=30) as response:
-                    response.raise_for_status()
-                    image_data = await response.read()
-                    cached_data = await self.process_image_data(image_data, media_data)
-                    
-                    if cached_data and not spotify_slide:
-                        if len(self.image_cache) >= self.cache_size:
-                            _, popped = self.image_cache.popitem(last=False)
-                            self._update_cache_memory_tracker(popped, add=False)
-                        
-                        self.image_cache[cache_key] = cached_data
-                        self._update_cache_memory_tracker(cached_data, add=True)
-                        
-                        media_data.image_cache_memory = format_memory_size(self._current_cache_memory)
-                        media_data.image_cache_count = self._cache_size
-            except Exception as e:
-                _LOGGER.error(f"Error fetching/processing image: {e}")
+            async def render() -> Optional[dict]:
+                try:
+                    image_data = None
+                    content_key = None
+                    generated_key = None
+                    if not (use_cache and self._has_base_stage(picture, media_data)):
+                        image_data, generated_key = await self._fetch_image_bytes(picture)
+                        content_key = hashlib.blake2b(image_data, digest_size=16).hexdigest() + cache_key[len(picture_key):]
+                        duplicate = self._content_lookup(content_key, cache_key, remember=not spotify_slide)
+                        if duplicate:
+                            self._keep_generated(generated_key, image_data)
+                            return duplicate
+
+                    if use_cache:
+                        rendered = await self._render_stages(picture, media_data, image_data)
+                    else:
+                        rendered = await self.process_image_data(image_data, media_data)
+
+                    if rendered:
+                        self._keep_generated(generated_key, image_data)
+                    if rendered and not spotify_slide:
+                        self._cache_put(cache_key, rendered)
+                        if content_key:
+                            self._bounded_put(self._content_index, content_key, cache_key)
+                    return rendered
+                except Exception as e:
+                    _LOGGER.error(f"Error fetching/processing image: {e}")
+                    return None
+
+            # Concurrent requests for the same frame share one download and render. Slide and TV
+            # requests render and cache differently, so they only join flights of their own kind.
+            rendered = await self._coalesced(("image", cache_key, use_cache, spotify_slide), render)
+            if not rendered:
                 return None
+            cached_data = dict(rendered)
+            if not spotify_slide:
+                self._report_cache_usage(media_data)
 
         if not cached_data:
             return None
 
-        final_img = cached_data['pil_image'].copy()
+        frame = cached_data.pop('frame', None)
+        if frame is not None:
+            # Cache hit: the only copy is the working image built straight from the stored pixels.
+            final_img = Image.frombytes("RGB", cached_data.pop('frame_size', (64, 64)), frame)
+            if isinstance(frame, memoryview):
+                frame.release()
+        else:
+            final_img = cached_data['pil_image'].copy()
         final_img = self.text_clock_img(final_img, cached_data, media_data)
         
         if self.config.info:
@@ -529,78 +1646,341 @@ class ImageProcessor:
             **cached_data 
         }
 
+    @staticmethod
+    def _bounded_put(index: OrderedDict, key: str, value: str):
+        index[key] = value
+        index.move_to_end(key)
+        while len(index) > CONTENT_INDEX_SIZE:
+            index.popitem(last=False)
+
+    def _cache_lookup(self, cache_key: str) -> Optional[dict]:
+        """URL key first, then the entry of another URL that served the same bytes."""
+        cached = self._cache_get(cache_key)
+        if cached is None and cache_key in self._url_aliases:
+            cached = self._cache_get(self._url_aliases[cache_key])
+        return cached
+
+    def _content_lookup(self, content_key: str, cache_key: str, remember: bool) -> Optional[dict]:
+        """Processed frame for bytes already seen under another URL, or None."""
+        owner = self._content_index.get(content_key)
+        cached = self._cache_get(owner) if owner else None
+        if not cached:
+            return None
+        frame = cached['frame']
+        if isinstance(frame, memoryview):
+            # The result may be shared by coalesced callers, so it cannot hold the store's view.
+            cached['frame'] = bytes(frame)
+            frame.release()
+        if remember and self.frame_store is not None:
+            # Persisted entries must survive a restart, when the in-memory alias is gone.
+            meta = {k: v for k, v in cached.items() if k != 'frame'}
+            self._cache_put(cache_key, {'pil_image': Image.frombytes("RGB", cached.get('frame_size', (64, 64)), cached['frame']), **meta})
+        elif remember:
+            self._bounded_put(self._url_aliases, cache_key, owner)
+        self.content_dedup_hits += 1
+        return cached
+
+    def _has_base_stage(self, picture: str, media_data: "MediaData") -> bool:
+        return self._base_stage_key(picture, media_data) in self._base_cache
+
+    def _base_stage_key(self, picture: str, media_data: "MediaData") -> tuple:
+        c = self.config
+        return (canonical_picture_key(picture)[0], c.crop_borders, c.crop_extra, c.special_mode, media_data.radio_logo)
+
+    async def _coalesced(self, key: tuple, factory) -> Any:
+        """
+        Single-flight: runs factory() once for concurrent callers with the same key; they all
+        await the same task. Shielded, so a cancelled caller does not cancel the shared work
+        while others still wait for it; once the last caller is cancelled the work is cancelled too
+        (e.g. the losers of a hedged race).
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            self.coalesce_stats['started'] += 1
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._inflight.pop(key, None) if self._inflight.get(key) is done else None)
+        else:
+            self.coalesce_stats['coalesced'] += 1
+        self._waiters[task] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                if not task.done():
+                    task.cancel()
+
+    async def _fetch_image_bytes(self, picture: str) -> Tuple[bytes, Optional[str]]:
+        """
+        Image bytes, plus the generated-art key to store them under once they render
+        (None unless this was a fresh AI download).
+        """
+        url = picture if picture.startswith('http') else f"{self.config.ha_url}{picture}"
+        picture_key, url_pattern = canonical_picture_key(url)
+        if url_pattern != "ai_generated" or self.generated_store is None:
+            return await self.download_image(url, timeout=30), None
+
+        loop = asyncio.get_event_loop()
+        image_data = await loop.run_in_executor(self._executor, self.generated_store.get, picture_key)
+        if image_data is not None:
+            return image_data, None
+        return await self.download_image(url, timeout=30), picture_key
+
+    def _keep_generated(self, generated_key: Optional[str], image_data: Optional[bytes]):
+        # Only bytes that decoded and rendered are kept; AI URLs are deterministic, so a stored
+        # error page would be replayed on every later play.
+        if generated_key and image_data and self.generated_store is not None:
+            self._executor.submit(self.generated_store.put, generated_key, image_data)
+
+    async def download_image(self, url: str, timeout: float = 30) -> bytes:
+        """Downloads an image; concurrent downloads of the same URL share one request."""
+        return await self._coalesced(("download", url), lambda: self._stream_download(url, timeout))
+
+    async def _stream_download(self, url: str, timeout: float) -> bytes:
+        """
+        Streams an image body, aborting once it passes max_download_mb or once its header
+        shows more pixels than MAX_SOURCE_PIXELS. Bytes, aborts and time to first byte are
+        tracked per host in download_stats.
+        """
+        cap = self.config.max_download_bytes
+        source = urllib.parse.urlsplit(url).hostname or "unknown"
+        stats = self.download_stats.setdefault(source, {'requests': 0, 'bytes': 0, 'aborted': 0, 'ttfb_ms': 0.0})
+        stats['requests'] += 1
+        parser: Optional[ImageFile.Parser] = ImageFile.Parser()
+        chunks = []
+        received = 0
+        start = time.perf_counter()
+        try:
+            async with self.session.get(url, timeout=timeout) as response:
+                stats['ttfb_ms'] = round((time.perf_counter() - start) * 1000, 1)
+                response.raise_for_status()
+                if (response.content_type or "").startswith("text/"):
+                    raise ValueError(f"{source} returned {response.content_type} instead of an image")
+                if cap and response.content_length and response.content_length > cap:
+                    raise ValueError(f"{source} image is {format_memory_size(response.content_length)}, over the {format_memory_size(cap)} limit")
+
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    received += len(chunk)
+                    if cap and received > cap:
+                        raise ValueError(f"{source} image exceeded the {format_memory_size(cap)} limit")
+                    chunks.append(chunk)
+                    if parser is not None:
+                        parser = self._probe_image_header(parser, chunk, received, source)
+        except Exception:
+            stats['aborted'] += 1
+            raise
+        finally:
+            stats['bytes'] += received
+        return b"".join(chunks)
+
+    @staticmethod
+    def _probe_image_header(parser: ImageFile.Parser, chunk: bytes, received: int, source: str) -> Optional[ImageFile.Parser]:
+        """Feeds the parser until the image size is known; returns None once probing is done."""
+        try:
+            parser.feed(chunk)
+        except Exception:
+            # Decoding happens later in the executor; the probe only looks for oversized images.
+            return None
+        if parser.image is not None:
+            width, height = parser.image.size
+            if width * height > MAX_SOURCE_PIXELS:
+                raise ValueError(f"{source} image is {width}x{height}, too large to process")
+            return None
+        return parser if received < HEADER_PROBE_BYTES else None
+
+    def _stage_get(self, cache: OrderedDict, key: tuple) -> Any:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _stage_nbytes(key: tuple, value: Any) -> int:
+        """
+        Estimated footprint of a stage cache entry: the decoded pixel buffer plus object headers.
+        The colour analysis a filtered entry collects later is small and not counted.
+        """
+        img = value['image'] if isinstance(value, dict) else value
+        size = sys.getsizeof(key) + CachedFrame.ENTRY_OVERHEAD + sys.getsizeof(img)
+        size += img.width * img.height * len(img.getbands())
+        if isinstance(value, dict):
+            size += sys.getsizeof(value) + sys.getsizeof(value['values'])
+        return size
+
+    def _stage_put(self, cache: OrderedDict, key: tuple, value: Any):
+        old = cache.pop(key, None)
+        if old is not None:
+            self._current_cache_memory -= self._stage_nbytes(key, old)
+        size = self._stage_nbytes(key, value)
+        if size > self.cache_budget:
+            return
+        while len(cache) >= STAGE_CACHE_SIZE:
+            popped_key, popped = cache.popitem(last=False)
+            self._current_cache_memory -= self._stage_nbytes(popped_key, popped)
+        self._make_room(size)
+        cache[key] = value
+        self._current_cache_memory += size
+
+    async def _render_stages(self, picture: str, media_data: "MediaData", image_data: Optional[bytes] = None) -> Optional[dict]:
+        """
+        Runs the pipeline as three cached tiers keyed by the source picture:
+        1. decoded, cropped 64x64 square (crop settings)
+        2. filtered frame and its colour analysis (filter settings)
+        3. burned text / special mode composition (stored by get_image)
+        A settings change only recomputes the tiers downstream of it.
+        """
+        loop = asyncio.get_event_loop()
+        c = self.config
+
+        base_key = self._base_stage_key(picture, media_data)
+        base = self._stage_get(self._base_cache, base_key)
+        if base is None:
+            generated_key = None
+            if image_data is None:
+                image_data, generated_key = await self._fetch_image_bytes(picture)
+            base = await self._run_base_stage(image_data, media_data.radio_logo)
+            if base is None:
+                return None
+            self._keep_generated(generated_key, image_data)
+            self._stage_put(self._base_cache, base_key, base)
+
+        filtered_key = (base_key, c.contrast, c.sharpness, c.colors, c.kernel, c.limit_color)
+        filtered = self._stage_get(self._filtered_cache, filtered_key)
+        if filtered is None:
+            filtered = {'image': await loop.run_in_executor(self._executor, self._filter_stage, base), 'values': {}}
+            self._stage_put(self._filtered_cache, filtered_key, filtered)
+
+        return await loop.run_in_executor(self._executor, self._compose_stage, filtered, media_data)
+
+    def _disable_process_pool(self, error: Exception):
+        _LOGGER.warning(f"Image process pool stopped working ({error}); using threads from now on.")
+        self._process_pool.shutdown(wait=False, cancel_futures=True)
+        self._process_pool = None
+
+    async def _run_base_stage(self, image_data: bytes, radio_logo: bool) -> Optional[Image.Image]:
+        loop = asyncio.get_event_loop()
+        if self._process_pool is not None:
+            try:
+                frame = await loop.run_in_executor(self._process_pool, base_stage_job, self.config.image_snapshot(), image_data, radio_logo)
+                return Image.frombytes("RGB", frame[1], frame[0]) if frame else None
+            except BrokenProcessPool as e:
+                self._disable_process_pool(e)
+        return await loop.run_in_executor(self._executor, self._base_stage, image_data, radio_logo)
+
     async def process_image_data(self, image_data: bytes, media_data: "MediaData") -> Optional[dict]:
         loop = asyncio.get_event_loop()
         try:
+            if self._process_pool is not None:
+                try:
+                    result = await loop.run_in_executor(
+                        self._process_pool, process_image_job, self.config.image_snapshot(),
+                        image_data, media_data.radio_logo, media_data.artist, media_data.title_clean,
+                    )
+                    if result is None:
+                        return None
+                    result['pil_image'] = Image.frombytes("RGB", result.pop('frame_size'), result.pop('frame'))
+                    media_data.lyrics_font_color = result.pop('lyrics_font_color')
+                    media_data.color1, media_data.color2, media_data.color3 = result['color1'], result['color2'], result['color3']
+                    return result
+                except BrokenProcessPool as e:
+                    self._disable_process_pool(e)
             return await loop.run_in_executor(self._executor, self._process_image, image_data, media_data)
         except Exception as e:
-            _LOGGER.exception(f"Error during thread pool image processing: {e}")
+            _LOGGER.exception(f"Error during image processing: {e}")
             return None
 
     def _process_image(self, image_data: bytes, media_data: "MediaData") -> Optional[dict]:
         try:
-            with Image.open(BytesIO(image_data)) as img:
-                img.load() 
-                img = ensure_rgb(img)
-                
-                max_dimension = 320
-                if max(img.size) > max_dimension:
-                    scale_factor = max_dimension / max(img.size)
-                    new_size = (int(img.width * scale_factor), int(img.height * scale_factor))
-                    img = img.resize(new_size, Image.Resampling.BICUBIC)
-
-                if (self.config.crop_borders or self.config.special_mode) and not media_data.radio_logo:
-                    img = self.crop_image_borders(img, media_data.radio_logo)
+            base = self._base_stage(image_data, media_data.radio_logo)
+            if base is None:
+                return None
+            return self._compose_stage({'image': self._filter_stage(base), 'values': {}}, media_data)
+        except Exception as e:
+            _LOGGER.error(f"Error processing image: {e}")
+            return None
 
-                img = self.fixed_size(img)
+    def _base_stage(self, image_data: bytes, radio_logo: bool) -> Optional[Image.Image]:
+        """Tier 1: decode, downscale, crop and square the cover."""
+        try:
+            max_dimension = 320
+            img = decode_image(image_data, max_dimension)
+            if img is None:
+                return None
 
-                if img.width > 64 or img.height > 64:
-                    img = img.resize((64, 64), Image.Resampling.BICUBIC)
+            if max(img.size) > max_dimension:
+                scale_factor = max_dimension / max(img.size)
+                new_size = (int(img.width * scale_factor), int(img.height * scale_factor))
+                img = img.resize(new_size, Image.Resampling.BICUBIC)
 
-                if self.config.contrast or self.config.sharpness or self.config.colors or self.config.kernel or self.config.limit_color:
-                    img = self.filter_image(img)
-                
-                if self.config.burned and not media_data.radio_logo:
-                    img = self._draw_burned_text(img, media_data.artist, media_data.title_clean)
+            if (self.config.crop_borders or self.config.special_mode) and not radio_logo:
+                img = self.crop_image_borders(img, radio_logo)
 
-                if self.config.special_mode:
-                    img = self.special_mode(img)
-                
-                vals = self.img_values(img)
-                
-                if self.config.force_font_color:
-                    media_data.lyrics_font_color = self.config.force_font_color
-                elif vals.get('font_color'):
-                    media_data.lyrics_font_color = vals['font_color']
-                elif vals.get('most_common_color_alternative'):
-                    media_data.lyrics_font_color = vals['most_common_color_alternative']
-                else:
-                    media_data.lyrics_font_color = "#FF00FF"
-
-                media_data.color1 = vals['color1']
-                media_data.color2 = vals['color2']
-                media_data.color3 = vals['color3']
-
-                return {
-                    'pil_image': img, 
-                    'font_color': vals['font_color'],
-                    'clock_color': vals['clock_color'],
-                    'temp_color': vals['temp_color'],
-                    'brightness': vals['brightness'],
-                    'brightness_lower_part': vals['brightness_lower_part'],
-                    'background_color': vals['background_color'],
-                    'background_color_rgb': vals['background_color_rgb'],
-                    'most_common_color_alternative_rgb': vals['most_common_color_alternative_rgb'],
-                    'most_common_color_alternative': vals['most_common_color_alternative'],
-                    'color1': vals['color1'],
-                    'color2': vals['color2'],
-                    'color3': vals['color3']
-                }
+            img = self.fixed_size(img)
 
+            if img.width > 64 or img.height > 64:
+                img = img.resize((64, 64), Image.Resampling.BICUBIC)
+            return img
         except Exception as e:
-            _LOGGER.error(f"Error processing image: {e}")
+            _LOGGER.error(f"Error decoding image: {e}")
             return None
 
+    def _filter_stage(self, img: Image.Image) -> Image.Image:
+        """Tier 2: colour/contrast/sharpness filters and palette limiting."""
+        if self.config.contrast or self.config.sharpness or self.config.colors or self.config.kernel or self.config.limit_color:
+            img = self.filter_image(img)
+        return img
+
+    def _compose_stage(self, filtered: dict, media_data: "MediaData") -> dict:
+        """Tier 3: burned text and special mode, then the colour analysis of the final frame."""
+        img = filtered['image']
+        composed = False
+        if self.config.burned and not media_data.radio_logo:
+            img = self._draw_burned_text(img, media_data.artist, media_data.title_clean)
+            composed = True
+
+        if self.config.special_mode:
+            img = self.special_mode(img)
+            composed = True
+
+        if composed:
+            vals = self.img_values(img)
+        else:
+            analysis_key = (self.config.top_text, self.config.text_bg, self.config.clock_align, bool(self.config.wled), self.config.force_font_color)
+            vals = filtered['values'].get(analysis_key)
+            if vals is None:
+                vals = filtered['values'][analysis_key] = self.img_values(img)
+        
+        if self.config.force_font_color:
+            media_data.lyrics_font_color = self.config.force_font_color
+        elif vals.get('font_color'):
+            media_data.lyrics_font_color = vals['font_color']
+        elif vals.get('most_common_color_alternative'):
+            media_data.lyrics_font_color = vals['most_common_color_alternative']
+        else:
+            media_data.lyrics_font_color = "#FF00FF"
+
+        media_data.color1 = vals['color1']
+        media_data.color2 = vals['color2']
+        media_data.color3 = vals['color3']
+
+        return {
+            'pil_image': img, 
+            'font_color': vals['font_color'],
+            'clock_color': vals['clock_color'],
+            'temp_color': vals['temp_color'],
+            'brightness': vals['brightness'],
+            'brightness_lower_part': vals['brightness_lower_part'],
+            'background_color': vals['background_color'],
+            'background_color_rgb': vals['background_color_rgb'],
+            'most_common_color_alternative_rgb': vals['most_common_color_alternative_rgb'],
+            'most_common_color_alternative': vals['most_common_color_alternative'],
+            'color1': vals['color1'],
+            'color2': vals['color2'],
+            'color3': vals['color3']
+        }
+
     def img_values(self, img: Image.Image) -> dict:
         """
         Orchestrates color analysis.
@@ -644,9 +2024,12 @@ class ImageProcessor:
              most_common_color_alternative = hex_color
         else:
              # get_best_color_for_zone MUST use full_img because of specific crop coordinates
-             text_c = self.get_best_color_for_zone(full_img, text_box, palette)
-             clock_c = self.get_best_color_for_zone(full_img, clock_box, palette)
-             temp_c = self.get_best_color_for_zone(full_img, temp_box, palette)
+             if self._vector_engine:
+                 text_c, clock_c, temp_c = self._vector_engine.best_colors_for_zones(full_img, (text_box, clock_box, temp_box), palette)
+             else:
+                 text_c = self.get_best_color_for_zone(full_img, text_box, palette)
+                 clock_c = self.get_best_color_for_zone(full_img, clock_box, palette)
+                 temp_c = self.get_best_color_for_zone(full_img, temp_box, palette)
              
              most_common_color_alternative_rgb = palette[0] if palette else (0,0,0)
              most_common_color_alternative = text_c
@@ -688,7 +2071,9 @@ class ImageProcessor:
         palette = quantized.getpalette()
         
         candidates = []
-        if palette:
+        if palette and self._vector_engine:
+            candidates = self._vector_engine.vibrant_palette([tuple(palette[i:i+3]) for i in range(0, len(palette)//3 * 3, 3)])
+        elif palette:
             raw_colors = [tuple(palette[i:i+3]) for i in range(0, len(palette)//3 * 3, 3)]
             for rgb in raw_colors:
                 r, g, b = rgb
@@ -748,6 +2133,14 @@ class ImageProcessor:
     async def process_slide_image(self, image_data: bytes, show_lyrics_is_on: bool, playing_radio_is_on: bool) -> Optional[str]:
         loop = asyncio.get_event_loop()
         try:
+            if self._process_pool is not None:
+                try:
+                    return await loop.run_in_executor(
+                        self._process_pool, process_slide_job, self.config.image_snapshot(),
+                        image_data, show_lyrics_is_on, playing_radio_is_on,
+                    )
+                except BrokenProcessPool as e:
+                    self._disable_process_pool(e)
             return await loop.run_in_executor(
                 self._executor, 
                 self._process_slide_image_sync, 
@@ -759,21 +2152,22 @@ class ImageProcessor:
 
     def _process_slide_image_sync(self, image_data: bytes, show_lyrics_is_on: bool, playing_radio_is_on: bool) -> Optional[str]:
         try:
-            with Image.open(BytesIO(image_data)) as img:
-                img = ensure_rgb(img)
-                img = self.fixed_size(img)
-                img = img.resize((64, 64), Image.Resampling.BICUBIC)
+            img = decode_image(image_data, 64)
+            if img is None:
+                return None
+            img = self.fixed_size(img)
+            img = img.resize((64, 64), Image.Resampling.BICUBIC)
 
-                if self.config.special_mode:
-                    img = self.special_mode(img)
+            if self.config.special_mode:
+                img = self.special_mode(img)
 
-                if show_lyrics_is_on and not playing_radio_is_on and not self.config.special_mode:
-                    enhancer_lp = ImageEnhance.Brightness(img)
-                    img = enhancer_lp.enhance(0.55)
-                    enhancer = ImageEnhance.Contrast(img)
-                    img = enhancer.enhance(0.5)
+            if show_lyrics_is_on and not playing_radio_is_on and not self.config.special_mode:
+                enhancer_lp = ImageEnhance.Brightness(img)
+                img = enhancer_lp.enhance(0.55)
+                enhancer = ImageEnhance.Contrast(img)
+                img = enhancer.enhance(0.5)
 
-                return self.gbase64(img)
+            return self.gbase64(img)
         except Exception as e:
             _LOGGER.error(f"Sync slide processing error: {e}")
             return None
@@ -1015,27 +2409,10 @@ class ImageProcessor:
         small_thumb = img.resize((25, 25), Image.Resampling.NEAREST)
         colors_raw = small_thumb.getcolors(maxcolors=625) or []
         
-        def vibrancy_score(item):
-            count, rgb = item
-            r, g, b = rgb[:3]
-            h, s, v = colorsys.rgb_to_hsv(r/255, g/255, b/255)
-            return (s * v * v) * (math.log(count) + 1)
-
-        sorted_vibrant = sorted(colors_raw, key=vibrancy_score, reverse=True)
-        
-        chosen_dominant_color = None
-        for _, color in sorted_vibrant:
-            rgb = color[:3]
-            h, s, v = colorsys.rgb_to_hsv(rgb[0]/255, rgb[1]/255, rgb[2]/255)
-            if s > 0.15 and 0.15 < v < 0.95:
-                chosen_dominant_color = rgb
-                break
-        
-        if not chosen_dominant_color and colors_raw:
-            for count, color in sorted(colors_raw, key=lambda x: x[0], reverse=True):
-                if sum(color[:3]) > 50:
-                    chosen_dominant_color = color[:3]
-                    break
+        if self._vector_engine:
+            chosen_dominant_color = self._vector_engine.dominant_color(colors_raw)
+        else:
+            chosen_dominant_color = self._dominant_color(colors_raw)
 
         if self.config.text_bg:
             if chosen_dominant_color:
@@ -1048,8 +2425,8 @@ class ImageProcessor:
             return "#00ffff"
 
         else:
-            stat = ImageStat.Stat(img)
-            avg_bg = tuple(int(x) for x in stat.mean[:3])
+            mean = self._vector_engine.mean_rgb(img) if self._vector_engine and img.mode == "RGB" else ImageStat.Stat(img).mean
+            avg_bg = tuple(int(x) for x in mean[:3])
             
             candidates = []
             
@@ -1069,30 +2446,10 @@ class ImageProcessor:
             candidates.append((255, 255, 255))
             candidates.append((0, 0, 0))
 
-            best_color = None
-            max_score = -100
-
-            for color in candidates:
-                contrast = self._contrast_ratio(color, avg_bg)
-                
-                r, g, b = color
-                h, s, v = colorsys.rgb_to_hsv(r/255, g/255, b/255)
-                is_grayscale = s < 0.1
-                
-                threshold = 4.0 if is_grayscale else 2.2
-                
-                if contrast < threshold: 
-                    continue
-
-                score = contrast
-                score += (s * 25.0) 
-                
-                if chosen_dominant_color and self.color_distance(color, chosen_dominant_color) < 30:
-                    score += 5.0
-                
-                if score > max_score:
-                    max_score = score
-                    best_color = color
+            if self._vector_engine:
+                best_color = self._vector_engine.best_font_color(candidates, avg_bg, chosen_dominant_color)
+            else:
+                best_color = self._best_font_color(candidates, avg_bg, chosen_dominant_color)
             
             if best_color:
                 return f'#{best_color[0]:02x}{best_color[1]:02x}{best_color[2]:02x}'
@@ -1100,6 +2457,54 @@ class ImageProcessor:
             white_contrast = self._contrast_ratio((255, 255, 255), avg_bg)
             return '#ffffff' if white_contrast > 3.0 else '#000000'
 
+    def _dominant_color(self, colors_raw: list) -> Optional[tuple]:
+        def vibrancy_score(item):
+            count, rgb = item
+            r, g, b = rgb[:3]
+            h, s, v = colorsys.rgb_to_hsv(r/255, g/255, b/255)
+            return (s * v * v) * (math.log(count) + 1)
+
+        sorted_vibrant = sorted(colors_raw, key=vibrancy_score, reverse=True)
+        
+        for _, color in sorted_vibrant:
+            rgb = color[:3]
+            h, s, v = colorsys.rgb_to_hsv(rgb[0]/255, rgb[1]/255, rgb[2]/255)
+            if s > 0.15 and 0.15 < v < 0.95:
+                return rgb
+        
+        for count, color in sorted(colors_raw, key=lambda x: x[0], reverse=True):
+            if sum(color[:3]) > 50:
+                return color[:3]
+        return None
+
+    def _best_font_color(self, candidates: list, avg_bg: tuple, chosen_dominant_color: Optional[tuple]) -> Optional[tuple]:
+        best_color = None
+        max_score = -100
+
+        for color in candidates:
+            contrast = self._contrast_ratio(color, avg_bg)
+            
+            r, g, b = color
+            h, s, v = colorsys.rgb_to_hsv(r/255, g/255, b/255)
+            is_grayscale = s < 0.1
+            
+            threshold = 4.0 if is_grayscale else 2.2
+            
+            if contrast < threshold: 
+                continue
+
+            score = contrast
+            score += (s * 25.0) 
+            
+            if chosen_dominant_color and self.color_distance(color, chosen_dominant_color) < 30:
+                score += 5.0
+            
+            if score > max_score:
+                max_score = score
+                best_color = color
+        
+        return best_color
+
     # ... [Rest of the class methods (get_dominant_border_color, crops, etc.) remain as is] ...
     # Ensure all helper methods from your original script are present here.
     def get_dominant_border_color(self, img: Image.Image) -> tuple:
@@ -1122,14 +2527,54 @@ class ImageProcessor:
 
     def _find_content_bounding_box(self, image_to_scan: Image.Image, border_color_to_detect: tuple, threshold: float) -> Optional[Tuple[int, int, int, int]]:
         try:
-            bg = Image.new("RGB", image_to_scan.size, border_color_to_detect)
-            diff = ImageChops.difference(image_to_scan, bg)
-            diff = ImageOps.grayscale(diff)
-            diff = diff.point(lambda p: 255 if p > 30 else 0)
-            return diff.getbbox()
+            # Per-channel |pixel - border| through a lookup table instead of diffing against a full-size background image.
+            diff_table = []
+            for c in border_color_to_detect[:3]:
+                diff_table.extend(range(c, 0, -1))
+                diff_table.extend(range(256 - c))
+            rgb = image_to_scan if image_to_scan.mode == "RGB" else image_to_scan.convert("RGB")
+            diff = rgb.point(diff_table).convert("L")
+            return diff.point(threshold_table(threshold)).getbbox()
         except Exception:
             return None
 
+    def _border_rows(self, window: Image.Image, border_color: tuple, thresh: float) -> tuple:
+        width, height = window.size
+        data = list(window.getdata())
+        thresh_sq = thresh * thresh
+        
+        top_border_rows = 0
+        for y in range(height):
+            is_border_row = True
+            row_start = y * width
+            for x in range(width):
+                r, g, b = data[row_start + x]
+                dist_sq = (r - border_color[0])**2 + (g - border_color[1])**2 + (b - border_color[2])**2
+                if dist_sq > thresh_sq:
+                    is_border_row = False
+                    break
+            if is_border_row:
+                top_border_rows += 1
+            else:
+                break
+                
+        bottom_border_rows = 0
+        for y in range(height - 1, -1, -1):
+            is_border_row = True
+            row_start = y * width
+            for x in range(width):
+                r, g, b = data[row_start + x]
+                dist_sq = (r - border_color[0])**2 + (g - border_color[1])**2 + (b - border_color[2])**2
+                if dist_sq > thresh_sq:
+                    is_border_row = False
+                    break
+            if is_border_row:
+                bottom_border_rows += 1
+            else:
+                break
+
+        return top_border_rows, bottom_border_rows
+
     def _balance_border(self, detect: Image.Image, orig: Image.Image, left: int, top: int, size: int, border_color: tuple, thresh: float) -> Image.Image:
         orig_width, orig_height = orig.size
         detect_width, detect_height = detect.size 
@@ -1156,39 +2601,12 @@ class ImageProcessor:
             if actual_crop_dim_orig < 1: return orig
             return orig.crop((final_left_orig, final_top_orig, final_left_orig + actual_crop_dim_orig, final_top_orig + actual_crop_dim_orig))
         
-        data = list(cropped_detect_window.getdata())
-        thresh_sq = thresh * thresh
-        
-        top_border_rows = 0
-        for y in range(local_size_h):
-            is_border_row = True
-            row_start = y * local_size_w
-            for x in range(local_size_w):
-                r, g, b = data[row_start + x]
-                dist_sq = (r - border_color[0])**2 + (g - border_color[1])**2 + (b - border_color[2])**2
-                if dist_sq > thresh_sq:
-                    is_border_row = False
-                    break
-            if is_border_row:
-                top_border_rows += 1
-            else:
-                break
-                
-        bottom_border_rows = 0
-        for y in range(local_size_h - 1, -1, -1):
-            is_border_row = True
-            row_start = y * local_size_w
-            for x in range(local_size_w):
-                r, g, b = data[row_start + x]
-                dist_sq = (r - border_color[0])**2 + (g - border_color[1])**2 + (b - border_color[2])**2
-                if dist_sq > thresh_sq:
-                    is_border_row = False
-                    break
-            if is_border_row:
-                bottom_border_rows += 1
-            else:
-                break
-                
+        # The border scan does not depend on color_engine: both versions give the same rows.
+        if numpy_support and cropped_detect_window.mode == "RGB":
+            top_border_rows, bottom_border_rows = VectorColorEngine.border_rows(cropped_detect_window, border_color, thresh)
+        else:
+            top_border_rows, bottom_border_rows = self._border_rows(cropped_detect_window, border_color, thresh)
+
         target_crop_dim = size 
         new_top_orig = top 
         if top_border_rows > 0 and bottom_border_rows == 0:
@@ -1435,10 +2853,7 @@ class ImageProcessor:
 
     def _contrast_ratio(self, c1: tuple, c2: tuple) -> float:
         def _luminance(c: tuple) -> float:
-            r, g, b = [v / 255 for v in c]
-            r = r / 12.92 if r <= 0.03928 else ((r + 0.055) / 1.055) ** 2.4
-            g = g / 12.92 if g <= 0.03928 else ((g + 0.055) / 1.055) ** 2.4
-            b = b / 12.92 if b <= 0.03928 else ((b + 0.055) / 1.055) ** 2.4
+            r, g, b = [SRGB_TO_LINEAR[v] if isinstance(v, int) and 0 <= v <= 255 else _srgb_channel_to_linear(v / 255) for v in c]
             return 0.2126 * r + 0.7152 * g + 0.0722 * b
         l1, l2 = _luminance(c1) + 0.05, _luminance(c2) + 0.05
         return max(l1, l2) / min(l1, l2)
@@ -1517,6 +2932,34 @@ class ImageProcessor:
 
         return img_copy.convert("RGB")
 
+# --- Process-pool jobs ---
+# Module-level so they pickle; each worker keeps one bare ImageProcessor per config snapshot.
+_worker_processors: Dict[ImageConfigSnapshot, ImageProcessor] = {}
+
+def _worker_processor(snapshot: ImageConfigSnapshot) -> ImageProcessor:
+    processor = _worker_processors.get(snapshot)
+    if processor is None:
+        if len(_worker_processors) >= 8:
+            _worker_processors.clear()
+        processor = _worker_processors[snapshot] = ImageProcessor.for_worker(snapshot)
+    return processor
+
+def base_stage_job(snapshot: ImageConfigSnapshot, image_data: bytes, radio_logo: bool) -> Optional[Tuple[bytes, Tuple[int, int]]]:
+    img = _worker_processor(snapshot)._base_stage(image_data, radio_logo)
+    return (img.tobytes(), img.size) if img is not None else None
+
+def process_image_job(snapshot: ImageConfigSnapshot, image_data: bytes, radio_logo: bool, artist: str, title_clean: str) -> Optional[dict]:
+    media = SimpleNamespace(radio_logo=radio_logo, artist=artist, title_clean=title_clean)
+    result = _worker_processor(snapshot)._process_image(image_data, media)
+    if result is None:
+        return None
+    img = ensure_rgb(result.pop('pil_image'))
+    result.update(frame=img.tobytes(), frame_size=img.size, lyrics_font_color=media.lyrics_font_color)
+    return result
+
+def process_slide_job(snapshot: ImageConfigSnapshot, image_data: bytes, show_lyrics_is_on: bool, playing_radio_is_on: bool) -> Optional[str]:
+    return _worker_processor(snapshot)._process_slide_image_sync(image_data, show_lyrics_is_on, playing_radio_is_on)
+
 class LyricsProvider:
     """Provides lyrics with Smart Scheduling logic (Event Based) and Fuzzy Matching."""
 
@@ -2152,9 +3595,6 @@ class MediaData:
             f"Extreme close-up of {clean_artist}'s eyes, with the reflection of '{clean_title}' visible in the iris, macro photography, intense detail"
         ]
         
-        selected_prompt = random.choice(prompts)
-        encoded_prompt = urllib.parse.quote(selected_prompt, safe='')
-        
         valid_image_models = {
             "flux", "flux-klein", "flux-klein-9b", 
             "zimage", "z-image", "z-image-turbo", 
@@ -2177,14 +3617,16 @@ class MediaData:
             # Fallback for typos, invalid names, or video models
             _LOGGER.warning(f"AI Model '{user_pref}' is invalid or not an image model. Defaulting to 'zimage'.")
             model = "zimage"
-        
-        seed = random.randint(1, 2147483647)
-        
-        # 3. Standard Dimensions (1024x1024 is native for these models)
-        width = 1024
-        height = 1024
-        
-        base_url = "https://gen.pollinations.ai/image/"
+
+        # 3. Same track and model -> same prompt and seed, so the URL (and the generated image) can be cached
+        track = f"{normalise_lookup_text(artist_name)}|{normalise_lookup_text(title)}|{model}"
+        digest = int.from_bytes(hashlib.blake2b(track.encode("utf-8"), digest_size=8).digest(), "big")
+        selected_prompt = prompts[digest % len(prompts)]
+        encoded_prompt = urllib.parse.quote(selected_prompt, safe='')
+        seed = 1 + (digest >> 8) % 2147483647
+
+        width = height = AI_IMAGE_SIZES.get(model, 1024)
+
         url_params = f"?model={model}&width={width}&height={height}&seed={seed}"
 
         # 4. Key Check (Only append if key looks valid)
@@ -2192,7 +3634,7 @@ class MediaData:
         if len(api_key) > 10:
             url_params += f"&key={api_key}"
         
-        return f"{base_url}{encoded_prompt}{url_params}"
+        return f"{AI_IMAGE_BASE_URL}{encoded_prompt}{url_params}"
 
     def clean_title(self, title: str) -> str: 
         if not title: return title
@@ -2203,9 +3645,15 @@ class MediaData:
         cleaned_title = ' '.join(cleaned_title.split())
         return cleaned_title
 
+# Outcome markers ('miss'/'skipped') of the provider search running in the current task, keyed by
+# provider. Set per _scored_lookup call, so concurrent lookups never see each other's markers.
+LOOKUP_OUTCOME: contextvars.ContextVar[Optional[Dict[str, str]]] = contextvars.ContextVar("lookup_outcome", default=None)
+
 class FallbackService:
     """Handles fallback logic to retrieve album art from various sources if the original picture is not available.""" 
 
+    INDEXED_SOURCES = ("Spotify", "Discogs", "Last.FM", "TIDAL", "MusicBrainz")
+
     def __init__(self, config: "Config", image_processor: "ImageProcessor", session: aiohttp.ClientSession, spotify_service: "SpotifyService", pixoo_device: "PixooDevice"): 
         self.config = config
         self.image_processor = image_processor
@@ -2220,6 +3668,131 @@ class FallbackService:
         self.fail_txt = False
         self.fallback = False
 
+        # Cold timeouts match the fixed per-request timeouts the providers used before the scoreboard.
+        self.scoreboard = ProviderScoreboard({"musicbrainz": 20.0})
+        self.negative_cache: Optional[NegativeCache] = None
+        self._negative_save_handle: Optional[asyncio.TimerHandle] = None
+        if config.negative_cache_hours:
+            self.negative_cache = NegativeCache(
+                os.path.join(config.cache_dir, "negative_lookups.json"),
+                float(config.negative_cache_hours) * 3600,
+                {
+                    "spotify": (config.spotify_client_id, config.spotify_client_secret),
+                    "discogs": config.discogs,
+                    "lastfm": config.lastfm,
+                    "tidal": (config.tidal_client_id, config.tidal_client_secret),
+                    "musicbrainz": None,
+                },
+            )
+        self.artwork_index: Optional[ArtworkIndex] = None
+        self._revalidations: Dict[tuple, asyncio.Task] = {}
+        if config.artwork_index_days:
+            providers = {
+                "spotify": config.spotify_client_id and config.spotify_client_secret,
+                "discogs": config.discogs,
+                "lastfm": config.lastfm,
+                "tidal": config.tidal_client_id and config.tidal_client_secret,
+                "musicbrainz": config.musicbrainz,
+            }
+            self.artwork_index = ArtworkIndex(
+                os.path.join(config.cache_dir, "artwork_index.sqlite3"),
+                float(config.artwork_index_days) * 86400,
+                [name for name, enabled in providers.items() if enabled],
+            )
+
+    def _known_miss(self, provider: str, artist: Optional[str], title: Optional[str]) -> bool:
+        if self.negative_cache is None or not self.negative_cache.is_miss(provider, artist, title):
+            return False
+        self._mark_outcome(provider, 'skipped')
+        _LOGGER.debug(f"Skipping {provider}: no artwork found for '{artist} - {title}' recently.")
+        return True
+
+    def _miss(self, provider: str, artist: Optional[str], title: Optional[str]) -> None:
+        """Records that provider answered but had no artwork; returns None for the lookup to return."""
+        self._mark_outcome(provider, 'miss')
+        if self.negative_cache is not None:
+            self.negative_cache.record_miss(provider, artist, title)
+            if self._negative_save_handle is None:
+                self._negative_save_handle = asyncio.get_event_loop().call_later(5, self.save_negative_cache)
+        return None
+
+    @staticmethod
+    def _mark_outcome(provider: str, outcome: str):
+        outcomes = LOOKUP_OUTCOME.get()
+        if outcomes is not None:
+            outcomes[provider] = outcome
+
+    def save_negative_cache(self):
+        self._negative_save_handle = None
+        if self.negative_cache is not None:
+            try:
+                self.image_processor._executor.submit(self.negative_cache.write, self.negative_cache.snapshot())
+            except RuntimeError:
+                pass  # Executor already shut down; close_negative_cache wrote the final snapshot.
+
+    def close_negative_cache(self):
+        """Cancels the pending background save and writes the cache synchronously."""
+        if self._negative_save_handle is not None:
+            self._negative_save_handle.cancel()
+            self._negative_save_handle = None
+        if self.negative_cache is not None:
+            self.negative_cache.write(self.negative_cache.snapshot())
+
+    async def _indexed_artwork(self, media_data: "MediaData") -> Optional[Tuple[str, str]]:
+        """(pic_source, url) this track resolved to before, if known; stale entries are revalidated in the background."""
+        if self.artwork_index is None:
+            return None
+        track = (media_data.artist, media_data.title, media_data.album)
+        entry = await asyncio.get_running_loop().run_in_executor(self.image_processor._executor, self.artwork_index.lookup, *track)
+        if entry is None:
+            return None
+        url, source, stale = entry
+        _LOGGER.debug(f"Artwork index: '{media_data.artist} - {media_data.title}' resolved to {source} before.")
+        if stale and track not in self._revalidations:
+            task = asyncio.ensure_future(self._revalidate_artwork(track, url))
+            self._revalidations[track] = task
+            task.add_done_callback(lambda _: self._revalidations.pop(track, None))
+        return source, url
+
+    def _remember_artwork(self, media_data: "MediaData"):
+        if self.artwork_index is not None and media_data.pic_source in self.INDEXED_SOURCES and media_data.pic_url:
+            self.image_processor._executor.submit(
+                self.artwork_index.store, media_data.artist, media_data.title, media_data.album,
+                media_data.pic_url, media_data.pic_source,
+            )
+
+    def _forget_artwork(self, media_data: "MediaData"):
+        if self.artwork_index is not None:
+            _LOGGER.info(f"Indexed artwork for '{media_data.artist} - {media_data.title}' is no longer usable; searching again.")
+            self.image_processor._executor.submit(self.artwork_index.forget, media_data.artist, media_data.title, media_data.album)
+
+    async def _revalidate_artwork(self, track: tuple, url: str):
+        """Confirms a stale index entry while its URL still answers, and drops it once the URL is gone."""
+        try:
+            async with self.session.get(url, timeout=10) as response:
+                status = response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            _LOGGER.debug(f"Could not revalidate indexed artwork {url}: {e}")
+            return
+        if status == 200:
+            update = self.artwork_index.confirm
+        elif 400 <= status < 500:
+            _LOGGER.debug(f"Indexed artwork {url} returned HTTP {status}; dropping it from the index.")
+            update = self.artwork_index.forget
+        else:
+            return
+        await asyncio.get_running_loop().run_in_executor(self.image_processor._executor, update, *track)
+
+    async def _spotify_album_id(self, media_data: "MediaData") -> tuple[Optional[str], Optional[str]]:
+        if self._known_miss("spotify", media_data.artist, media_data.title):
+            return None, None
+        album_id, first_album = await self.spotify_service.get_spotify_album_id(media_data)
+        # None means no answer (token or HTTP failure); only an empty search result is a miss.
+        spotify_data = self.spotify_service.spotify_data
+        if isinstance(spotify_data, dict) and not spotify_data.get('tracks', {}).get('items'):
+            self._miss("spotify", media_data.artist, media_data.title)
+        return album_id, first_album
+
     async def get_final_url(self, picture: Optional[str], media_data: "MediaData") -> Optional[dict]: 
         self.fail_txt = False
         self.fallback = False
@@ -2251,6 +3824,17 @@ class FallbackService:
                     'most_common_color_alternative_rgb': (0,0,0), 'most_common_color_alternative': '#ffff00',
                     'color1': '#000000', 'color2': '#000000', 'color3': '#000000'}
 
+        if self.config.fallback_hedge_delay is not None:
+            indexed = await self._indexed_artwork(media_data)
+            result = await self._hedged_lookup(picture, media_data, indexed)
+            if result is None and indexed:
+                self._forget_artwork(media_data)
+                indexed = None
+                result = await self._hedged_lookup(None, media_data)
+            if result and not indexed:
+                self._remember_artwork(media_data)
+            return result or await self._last_resort(media_data)
+
         try:
             if not media_data.playing_radio or media_data.radio_logo:
                 result = await self.image_processor.get_image(picture, media_data, media_data.spotify_slide_pass)
@@ -2261,6 +3845,15 @@ class FallbackService:
         except Exception as e: 
             _LOGGER.error(f"Original picture processing failed: {e}") 
 
+        if indexed := await self._indexed_artwork(media_data):
+            source, url = indexed
+            result = await self.image_processor.get_image(url, media_data, media_data.spotify_slide_pass)
+            if result:
+                media_data.pic_url = url
+                media_data.pic_source = source
+                return result
+            self._forget_artwork(media_data)
+
         _LOGGER.info(f"Falling back to alternative album art sources for '{media_data.artist} - {media_data.title}'.") 
         self.spotify_first_album = None
         self.spotify_artist_pic = None
@@ -2272,7 +3865,7 @@ class FallbackService:
             if self.config.info: await self.send_info(media_data.artist, "SPOTIFY", media_data.lyrics_font_color)
             try:
                 spotify_service = self.spotify_service 
-                album_id, first_album = await spotify_service.get_spotify_album_id(media_data)
+                album_id, first_album = await self._spotify_album_id(media_data)
                 
                 if first_album:
                     self.spotify_first_album = await spotify_service.get_spotify_album_image_url(first_album)
@@ -2284,6 +3877,7 @@ class FallbackService:
                         if result:
                             media_data.pic_url = image_url
                             media_data.pic_source = "Spotify"
+                            self._remember_artwork(media_data)
                             return result
                 
                 self.spotify_artist_pic = await spotify_service.get_spotify_artist_image_url_by_name(media_data.artist)
@@ -2292,35 +3886,168 @@ class FallbackService:
         
         if self.config.info: await self.send_info(media_data.artist, "SEARCHING...", media_data.lyrics_font_color)
 
-        tasks = []
-        providers = []
-
-        if self.config.discogs:
-            tasks.append(self.search_discogs_album_art(media_data.artist, media_data.title))
-            providers.append("Discogs")
-        if self.config.lastfm:
-            tasks.append(self.search_lastfm_album_art(media_data.artist, media_data.title))
-            providers.append("Last.FM")
-        if self.config.tidal_client_id and self.config.tidal_client_secret:
-            tasks.append(self.get_tidal_album_art_url(media_data.artist, media_data.title))
-            providers.append("TIDAL")
-        if self.config.musicbrainz:
-            tasks.append(self.get_musicbrainz_album_art_url(media_data.artist, media_data.title))
-            providers.append("MusicBrainz")
+        # All providers search concurrently, but results are taken in priority order: a hit is used as
+        # soon as every higher-priority provider has come up empty, and the slower searches are cancelled.
+        lookups = [(name, asyncio.ensure_future(lookup())) for name, lookup in self._provider_lookups(media_data)]
+        try:
+            for provider_name, task in lookups:
+                try:
+                    result = await task
+                except Exception as e:
+                    _LOGGER.debug(f"{provider_name} artwork lookup failed: {e}")
+                    continue
+                if not result: continue
 
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for i, result in enumerate(results):
-                if isinstance(result, Exception) or not result: continue
-                
-                provider_name = providers[i]
                 if self.config.info: await self.send_info(media_data.artist, provider_name.upper(), media_data.lyrics_font_color)
-                
+
                 proc_result = await self.image_processor.get_image(result, media_data, media_data.spotify_slide_pass)
                 if proc_result:
                     media_data.pic_url = result
                     media_data.pic_source = provider_name
+                    self._remember_artwork(media_data)
                     return proc_result
+        finally:
+            for _, task in lookups:
+                if not task.done():
+                    task.cancel()
+
+        return await self._last_resort(media_data)
+
+    def _provider_lookups(self, media_data: "MediaData") -> list:
+        """
+        (name, lookup) for each configured provider, best first according to the scoreboard;
+        providers with an open circuit are left out. lookup() returns an image URL or None.
+        """
+        artist, title = media_data.artist, media_data.title
+        configured = {}
+        if self.config.discogs:
+            configured["discogs"] = ("Discogs", self.search_discogs_album_art)
+        if self.config.lastfm:
+            configured["lastfm"] = ("Last.FM", self.search_lastfm_album_art)
+        if self.config.tidal_client_id and self.config.tidal_client_secret:
+            configured["tidal"] = ("TIDAL", self.get_tidal_album_art_url)
+        if self.config.musicbrainz:
+            configured["musicbrainz"] = ("MusicBrainz", self.get_musicbrainz_album_art_url)
+
+        lookups = []
+        for key in self.scoreboard.order(list(configured)):
+            if not self.scoreboard.available(key):
+                continue
+            name, search = configured[key]
+            lookups.append((name, lambda key=key, search=search: self._scored_lookup(key, search, artist, title)))
+        return lookups
+
+    async def _scored_lookup(self, provider: str, search, artist: Optional[str], title: Optional[str]) -> Optional[str]:
+        """Runs a provider search under its adaptive timeout and records the outcome on the scoreboard."""
+        outcomes: Dict[str, str] = {}
+        token = LOOKUP_OUTCOME.set(outcomes)
+        start = time.perf_counter()
+        try:
+            url = await asyncio.wait_for(search(artist, title), timeout=self.scoreboard.timeout(provider))
+        except asyncio.TimeoutError:
+            _LOGGER.debug(f"{provider} lookup timed out after {self.scoreboard.timeout(provider):.1f}s")
+            url, outcome = None, 'error'
+        else:
+            # The searches return None both for "nothing found" and for errors; _miss/_known_miss tell them apart.
+            outcome = 'hit' if url else outcomes.get(provider) or 'error'
+        finally:
+            LOOKUP_OUTCOME.reset(token)
+        if outcome != 'skipped':
+            self.scoreboard.record(provider, outcome, time.perf_counter() - start)
+        return url
+
+    async def _spotify_album_image_url(self, media_data: "MediaData") -> Optional[str]:
+        album_id, first_album = await self._spotify_album_id(media_data)
+        if first_album:
+            self.spotify_first_album = await self.spotify_service.get_spotify_album_image_url(first_album)
+        image_url = await self.spotify_service.get_spotify_album_image_url(album_id) if album_id else None
+        if not image_url:
+            self.spotify_artist_pic = await self.spotify_service.get_spotify_artist_image_url_by_name(media_data.artist)
+        return image_url
+
+    async def _hedged_lookup(self, picture: Optional[str], media_data: "MediaData", indexed: Optional[Tuple[str, str]] = None) -> Optional[dict]:
+        """
+        Hedged resolution: the original picture gets a head start of fallback_hedge_delay seconds,
+        then Spotify and the other providers race it. The first artwork to arrive wins (by priority
+        when several arrive together) and the others are cancelled. Returns None if every source came up empty.
+        An `indexed` (pic_source, url) replaces the provider searches.
+        """
+        self.spotify_first_album = None
+        self.spotify_artist_pic = None
+        candidates = []
+        if picture and (not media_data.playing_radio or media_data.radio_logo):
+            candidates.append(("Original", picture))
+        if indexed:
+            candidates.append(indexed)
+        else:
+            if self.config.spotify_client_id and self.config.spotify_client_secret:
+                candidates.append(("Spotify", lambda: self._spotify_album_image_url(media_data)))
+            candidates.extend(self._provider_lookups(media_data))
+
+        async def resolve(source, scratch: "MediaData") -> Optional[tuple]:
+            url = source if isinstance(source, str) else await source()
+            if not url:
+                return None
+            result = await self.image_processor.get_image(url, scratch, media_data.spotify_slide_pass)
+            return (url, result) if result else None
+
+        # Racing renders must not write colours into the shared MediaData; each gets a scratch copy.
+        racers = []
+        def start(name, source):
+            scratch = copy.copy(media_data)
+            racers.append((name, asyncio.ensure_future(resolve(source, scratch)), scratch))
+
+        try:
+            if candidates and candidates[0][0] == "Original":
+                start(*candidates.pop(0))
+                await asyncio.wait([racers[0][1]], timeout=self.config.fallback_hedge_delay)
+                if racers[0][1].done() and self._race_outcome(racers[0]):
+                    return self._accept_racer(racers[0], media_data)
+                _LOGGER.info(f"Original artwork not ready after {self.config.fallback_hedge_delay}s; racing other sources.")
+            for name, source in candidates:
+                start(name, source)
+
+            while True:
+                # Among the racers that have finished, the highest-priority one with artwork wins.
+                for racer in racers:
+                    if racer[1].done() and self._race_outcome(racer):
+                        return self._accept_racer(racer, media_data)
+                pending = [task for _, task, _ in racers if not task.done()]
+                if not pending:
+                    return None
+                await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for _, task, _ in racers:
+                if not task.done():
+                    task.cancel()
+
+    @staticmethod
+    def _race_outcome(racer: tuple) -> Optional[tuple]:
+        name, task, _ = racer
+        if task.cancelled():
+            return None
+        if task.exception() is not None:
+            _LOGGER.debug(f"{name} artwork lookup failed: {task.exception()}")
+            return None
+        return task.result()
+
+    def _accept_racer(self, racer: tuple, media_data: "MediaData") -> dict:
+        name, task, scratch = racer
+        url, result = task.result()
+        for field in ('lyrics_font_color', 'color1', 'color2', 'color3', 'image_cache_memory', 'image_cache_count', 'info_img'):
+            setattr(media_data, field, getattr(scratch, field))
+        if name != "Original":
+            media_data.pic_url = url
+        media_data.pic_source = name
+        return result
+
+    async def _last_resort(self, media_data: "MediaData") -> dict:
+        if self.config.fallback_hedge_delay is not None and self.spotify_artist_pic is None \
+                and self.config.spotify_client_id and self.config.spotify_client_secret:
+            try:
+                self.spotify_artist_pic = await self.spotify_service.get_spotify_artist_image_url_by_name(media_data.artist)
+            except Exception as e:
+                _LOGGER.error(f"Spotify artist lookup failed: {e}")
 
         # 7. Fallback Level 2: Spotify Artist Picture
         if self.spotify_artist_pic:
@@ -2405,7 +4132,7 @@ class FallbackService:
                 {"Command": "Draw/SendHttpGif",
                     "PicNum": 1, "PicWidth": 64, "PicOffset": 0,
                     "PicID": 0, "PicSpeed": 10000, "PicData": base64_image }]}
-        await self.pixoo_device.send_command(payload)
+        await self.pixoo_device.send_command(payload, kind="image")
 
     async def send_info(self, artist: Optional[str], text: str, lyrics_font_color: str) -> None: 
         if not self.pixoo_device: return
@@ -2423,27 +4150,32 @@ class FallbackService:
             "TextWidth": 64, "Textheight": 16, "speed": 100, "align": 2, 
             "TextString": text, "color": "#00FF00"
         })
-        await self.pixoo_device.send_command({"Command": "Draw/SendHttpItemList", "ItemList": items})
+        await self.pixoo_device.send_command({"Command": "Draw/SendHttpItemList", "ItemList": items}, kind="info")
     
     async def get_musicbrainz_album_art_url(self, ai_artist: str, ai_title: str) -> Optional[str]: 
         search_url = "https://musicbrainz.org/ws/2/release/"
         headers = { "Accept": "application/json", "User-Agent": "PixooClient/1.0" }
         params = { "query": f'artist:"{ai_artist}" AND recording:"{ai_title}"', "fmt": "json" }
+        if self._known_miss("musicbrainz", ai_artist, ai_title): return None
         try:
             async with self.session.get(search_url, params=params, headers=headers, timeout=10) as response: 
                 response.raise_for_status() 
                 data = await response.json()
-                if not data.get("releases"): return None
+                if not data.get("releases"): return self._miss("musicbrainz", ai_artist, ai_title)
                 release_id = data["releases"][0]["id"]
                 cover_art_url = f"https://coverartarchive.org/release/{release_id}"
                 try: 
                     async with self.session.get(cover_art_url, headers=headers, timeout=20) as art_response: 
+                        # Cover Art Archive answers 404 for a release without artwork: a miss, not an error.
+                        if art_response.status == 404: return self._miss("musicbrainz", ai_artist, ai_title)
                         art_response.raise_for_status() 
                         art_data = await art_response.json()
                         for image in art_data.get("images", []):
                             if image.get("front", False):
-                                return image.get("thumbnails", {}).get("250")
-                        return None
+                                thumbnails = image.get("thumbnails", {})
+                                variants = [(int(size), url) for size, url in thumbnails.items() if size.isdigit()]
+                                return select_image_variant(variants, self.config.artwork_min_edge) or thumbnails.get("250")
+                        return self._miss("musicbrainz", ai_artist, ai_title)
                 except Exception: return None
         except Exception: return None
 
@@ -2451,30 +4183,36 @@ class FallbackService:
         base_url = "https://api.discogs.com/database/search"
         headers = { "User-Agent": "AlbumArtSearchApp/1.0", "Authorization": f"Discogs token={self.config.discogs}" }
         params = { "artist": ai_artist, "track": ai_title, "type": "release", "format": "album", "per_page": 5 }
+        if self._known_miss("discogs", ai_artist, ai_title): return None
         try:
             async with self.session.get(base_url, headers=headers, params=params, timeout=10) as response: 
                 response.raise_for_status() 
                 data = await response.json()
                 results = data.get("results", [])
-                if not results: return None
-                return results[0].get("cover_image")
+                cover_image = results[0].get("cover_image") if results else None
+                if not cover_image: return self._miss("discogs", ai_artist, ai_title)
+                return cover_image
         except Exception: return None
 
     async def search_lastfm_album_art(self, ai_artist: str, ai_title: str) -> Optional[str]: 
         base_url = "http://ws.audioscrobbler.com/2.0/"
         params = { "method": "track.getInfo", "api_key": self.config.lastfm, "artist": ai_artist, "track": ai_title, "format": "json" }
+        if self._known_miss("lastfm", ai_artist, ai_title): return None
         try:
             async with self.session.get(base_url, params=params, timeout=10) as response: 
                 response.raise_for_status() 
                 data = await response.json()
                 album_art_url_list = data.get("track", {}).get("album", {}).get("image", []) 
-                if album_art_url_list:
-                    return album_art_url_list[-1]["#text"] 
-                return None
+                variants = [(LASTFM_IMAGE_EDGES.get(image.get("size"), 0), image.get("#text")) for image in album_art_url_list]
+                url = select_image_variant(variants, self.config.artwork_min_edge) or (album_art_url_list[-1]["#text"] if album_art_url_list else None)
+                if url:
+                    return url
+                return self._miss("lastfm", ai_artist, ai_title)
         except Exception: return None
 
     async def get_tidal_album_art_url(self, artist: str, title: str) -> Optional[str]: 
         base_url = "https://openapi.tidal.com/v2/"
+        if self._known_miss("tidal", artist, title): return None
         access_token = await self.get_tidal_access_token()
         if not access_token: return None
         headers = { "Authorization": f"Bearer {access_token}", "Content-Type": "application/json" }
@@ -2485,13 +4223,17 @@ class FallbackService:
                 response.raise_for_status() 
                 search_data = await response.json()
                 albums = [item for item in search_data.get("included", []) if item.get("type") == "albums"]
-                if not albums: return None
+                if not albums: return self._miss("tidal", artist, title)
                 best_album = albums[0] 
                 if best_album:
                     image_links = best_album.get("attributes", {}).get("imageLinks", [])
+                    variants = [(min(link.get("meta", {}).get("width") or 0, link.get("meta", {}).get("height") or 0), link.get("href")) for link in image_links]
+                    url = select_image_variant(variants, self.config.artwork_min_edge)
+                    if url:
+                        return url
                     if image_links and len(image_links) > 3: 
                         return image_links[3].get("href")
-                return None
+                return self._miss("tidal", artist, title)
         except Exception: return None
 
     async def get_tidal_access_token(self) -> Optional[str]: 
@@ -2688,11 +4430,12 @@ class SpotifyService:
 
     async def get_spotify_album_id(self, media_data: "MediaData") -> tuple[Optional[str], Optional[str]]: 
         """Get the Spotify album ID and first album ID."""
+        # Reset first: spotify_data stays None unless this search got an answer.
+        self.spotify_data = None
         token = await self.get_spotify_access_token()
         if not token:
             return None, None 
         try:
-            self.spotify_data = None 
             response_json = await self.get_spotify_json(media_data.artist, media_data.title)
             self.spotify_data = response_json 
             tracks = response_json.get('tracks', {}).get('items', [])
@@ -2721,7 +4464,7 @@ class SpotifyService:
                 response_json = await response.json()
                 images = response_json.get('images', [])
                 if images:
-                    return images[0]['url'] 
+                    return select_image_variant(spotify_image_variants(images), self.config.artwork_min_edge) or images[0]['url'] 
                 return None
         except Exception: 
             return None
@@ -2769,7 +4512,7 @@ class SpotifyService:
                 response_json = await response.json()
                 images = response_json.get('images', [])
                 if images:
-                    return images[0]['url'] 
+                    return select_image_variant(spotify_image_variants(images), self.config.artwork_min_edge) or images[0]['url'] 
                 return None
         except Exception: 
             return None
@@ -2812,7 +4555,7 @@ class SpotifyService:
             for album in sorted_albums:
                 images = album.get("images", [])
                 if images:
-                    album_urls.append(images[0]["url"])
+                    album_urls.append(select_image_variant(spotify_image_variants(images), SLIDE_IMAGE_EDGE) or images[0]["url"])
 
             media_data.pic_url = album_urls
             media_data.pic_source = "Spotify (Slide)"
@@ -2842,9 +4585,7 @@ class SpotifyService:
     async def get_slide_img(self, picture: str, show_lyrics_is_on: bool, playing_radio_is_on: bool) -> Optional[str]: 
         """Fetches and processes image for Spotify slide using the optimized ImageProcessor."""
         try:
-            async with self.session.get(picture, timeout=10) as response: 
-                response.raise_for_status() 
-                image_raw_data = await response.read()
+            image_raw_data = await self.image_processor.download_image(picture, timeout=10)
 
             return await self.image_processor.process_slide_image(
                 image_raw_data, 
@@ -2894,9 +4635,8 @@ class SpotifyService:
             async def process_pipeline(url):
                 async with self._semaphore:
                     try:
-                        async with self.session.get(url, timeout=10) as response:
-                            raw_data = await response.read()
-                            return await self.image_processor.process_slide_image(raw_data, bool(media_data.lyrics), media_data.playing_radio)
+                        raw_data = await self.image_processor.download_image(url, timeout=10)
+                        return await self.image_processor.process_slide_image(raw_data, bool(media_data.lyrics), media_data.playing_radio)
                     except: return None
 
             tasks = [process_pipeline(url) for url in album_urls[:10]]
@@ -2925,22 +4665,24 @@ class SpotifyService:
             artist_img = None
             artist_pic_url = await self.get_spotify_artist_image_url_by_name(media_data.artist)
             if artist_pic_url:
-                async with self.session.get(artist_pic_url, timeout=5) as response:
-                    raw_data = await response.read()
+                try:
+                    raw_data = await self.image_processor.download_image(artist_pic_url, timeout=5)
                     loop = asyncio.get_event_loop()
                     artist_img = await loop.run_in_executor(self.image_processor._executor, _resize_image_sync, raw_data)
-                    
-                    if artist_img:
-                        preview_canvas = Image.new("RGB", (64, 64), (0, 0, 0))
-                        preview_canvas.paste(artist_img, (16, 8)) 
-                        preview_b64 = self.image_processor.gbase64(preview_canvas)
-                        
-                        # WORKAROUND: Break loop by switching to prev_channel
-                        await pixoo_device.send_command({"Command": "Draw/CommandList", "CommandList": [
-                        #    {"Command": "Channel/SetIndex", "SelectIndex": prev_channel},
-                            {"Command": "Draw/ResetHttpGifId"},
-                            {"Command": "Draw/SendHttpGif", "PicNum": 1, "PicWidth": 64, "PicOffset": 0, "PicID": 0, "PicSpeed": 1000, "PicData": preview_b64}
-                        ]})
+                except Exception as e:
+                    _LOGGER.debug(f"Artist image download failed: {e}")
+
+                if artist_img:
+                    preview_canvas = Image.new("RGB", (64, 64), (0, 0, 0))
+                    preview_canvas.paste(artist_img, (16, 8)) 
+                    preview_b64 = self.image_processor.gbase64(preview_canvas)
+
+                    # WORKAROUND: Break loop by switching to prev_channel
+                    await pixoo_device.send_command({"Command": "Draw/CommandList", "CommandList": [
+                    #    {"Command": "Channel/SetIndex", "SelectIndex": prev_channel},
+                        {"Command": "Draw/ResetHttpGifId"},
+                        {"Command": "Draw/SendHttpGif", "PicNum": 1, "PicWidth": 64, "PicOffset": 0, "PicID": 0, "PicSpeed": 1000, "PicData": preview_b64}
+                    ]})
                         
 
             # --- STEP 2: PARALLEL PREPARATION ---
@@ -2949,9 +4691,7 @@ class SpotifyService:
 
             def prepare_album_variants(raw_data):
                 try:
-                    img = Image.open(BytesIO(raw_data))
-                    img.load()
-                    img = img.convert("RGB").resize((34, 34), Image.Resampling.BICUBIC)
+                    img = decode_image(raw_data, 34).resize((34, 34), Image.Resampling.BICUBIC)
                     active = img.copy()
                     draw = ImageDraw.Draw(active); draw.rectangle([0, 0, 33, 33], outline="black", width=1)
                     inactive = img.filter(ImageFilter.GaussianBlur(2))
@@ -2961,7 +4701,7 @@ class SpotifyService:
 
             async def download(url):
                 try:
-                    async with self.session.get(url, timeout=10) as resp: return await resp.read()
+                    return await self.image_processor.download_image(url, timeout=10)
                 except: return None
 
             raw_datas = await asyncio.gather(*[download(u) for u in album_urls[:10]])
@@ -3296,7 +5036,7 @@ class NotificationManager:
                 await self.pixoo.send_command({
                     "Command": "Draw/SendHttpItemList",
                     "ItemList": text_items
-                })
+                }, kind="text")
 
             await asyncio.sleep(duration)
 
@@ -3592,9 +5332,20 @@ class Pixoo64_Media_Album_Art(hass.Hass):
     async def initialize(self):
         self.config = Config(self.args)
         
-        self.websession = aiohttp.ClientSession()
+        # Each Pixoo gets its own single keep-alive connection so slow internet APIs can never hold up
+        # a screen update; everything else shares a pool with per-host limits and cached DNS.
+        self.pool_stats: Dict[str, dict] = {'pixoo': {}, 'api': {}}
+        self.pixoo_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=max(1, len(self.config.pixoo_urls)), limit_per_host=1, keepalive_timeout=60, use_dns_cache=False),
+            trace_configs=[pool_trace(self.pool_stats['pixoo'])],
+        )
+        self.websession = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=8, ttl_dns_cache=300),
+            trace_configs=[pool_trace(self.pool_stats['api'])],
+        )
         self.is_art_visible = False
-        self.pixoo_device = PixooDevice(self.config, self.websession)
+        self.pixoo_devices = [PixooDevice(self.config, self.pixoo_session, url) for url in self.config.pixoo_urls or [None]]
+        self.pixoo_device = self.pixoo_devices[0] if len(self.pixoo_devices) == 1 else PixooGroup(self.pixoo_devices)
         
         self.image_processor = ImageProcessor(self.config, self.websession)
         self.spotify_service = SpotifyService(self.config, self.websession, self.image_processor)
@@ -3644,10 +5395,14 @@ class Pixoo64_Media_Album_Art(hass.Hass):
 
     async def terminate(self):
         self._stop_lyrics_scheduler()
+        if hasattr(self, 'fallback_service'): self.fallback_service.close_negative_cache()
         if hasattr(self, 'image_processor'): self.image_processor.shutdown()
+        if hasattr(self, 'fallback_service') and self.fallback_service.artwork_index is not None:
+            self.fallback_service.artwork_index.close()
         if self.current_image_task and not self.current_image_task.done(): self.current_image_task.cancel()
         if self.debounce_task and not self.debounce_task.done(): self.debounce_task.cancel()
         if hasattr(self, 'websession') and not self.websession.closed: await self.websession.close()
+        if hasattr(self, 'pixoo_session') and not self.pixoo_session.closed: await self.pixoo_session.close()
 
     async def _lyrics_sync_changed(self, entity, attribute, old, new, kwargs):
         await self._apply_lyrics_sync()
@@ -3670,7 +5425,6 @@ class Pixoo64_Media_Album_Art(hass.Hass):
             elif m == "crop": self.config.crop_borders, self.config.crop_extra = True, False
             elif m == "extra crop": self.config.crop_borders, self.config.crop_extra = True, True
             elif m == "default": self.config.crop_borders, self.config.crop_extra = self.config.original_crop_borders, self.config.original_crop_extra
-            self.image_processor.image_cache.clear()
             current_state = await self.get_state(self.config.media_player)
             if current_state in ["playing", "on"]:
                 await self.safe_state_change_callback(self.config.media_player, "state", None, "playing", {})
@@ -3715,7 +5469,6 @@ class Pixoo64_Media_Album_Art(hass.Hass):
                 self.config.ai_fallback, self.config.burned = self.config.original_ai_fallback, self.config.original_burned
                 self.config.special_mode_spotify_slider = self.config.original_special_mode_spotify_slider
             
-            self.image_processor.image_cache.clear()
             await self._start_or_stop_lyrics_scheduler()
             current_state = await self.get_state(self.config.media_player)
             if current_state in ["playing", "on"]:
@@ -3765,7 +5518,7 @@ class Pixoo64_Media_Album_Art(hass.Hass):
             
             current_hash = hash(str(pixoo_items))
             if current_hash != self.last_text_payload_hash or delay is None:
-                await self.pixoo_device.send_command({"Command": "Draw/SendHttpItemList", "ItemList": pixoo_items})
+                await self.pixoo_device.send_command({"Command": "Draw/SendHttpItemList", "ItemList": pixoo_items}, kind="text")
                 self.last_text_payload_hash = current_hash
         
         self.run_in(self._timer_callback_wrapper, delay if delay is not None else 5, gen_id=current_gen_id)
@@ -3811,7 +5564,7 @@ class Pixoo64_Media_Album_Art(hass.Hass):
             current_hash = hash(str(payload))
             
             if current_hash != self.last_text_payload_hash:
-                await self.pixoo_device.send_command(payload)
+                await self.pixoo_device.send_command(payload, kind="text")
                 self.last_text_payload_hash = current_hash
 
     async def safe_state_change_callback(self, entity, attribute, old, new, kwargs):
@@ -4025,6 +5778,16 @@ class Pixoo64_Media_Album_Art(hass.Hass):
                 "color_alternative": most_common_color_alternative_rgb_str,
                 "images_in_cache": media_data.image_cache_count,
                 "image_memory_cache": media_data.image_cache_memory,
+                "image_downloads": {host: dict(stats) for host, stats in self.image_processor.download_stats.items()},
+                "image_requests_coalesced": dict(self.image_processor.coalesce_stats),
+                "images_deduplicated": self.image_processor.content_dedup_hits,
+                "artwork_lookups_skipped": self.fallback_service.negative_cache.hits if self.fallback_service.negative_cache else 0,
+                "artwork_index_hits": self.fallback_service.artwork_index.hits if self.fallback_service.artwork_index else 0,
+                "ai_images_reused": self.image_processor.generated_store.hits if self.image_processor.generated_store else 0,
+                "provider_scoreboard": self.fallback_service.scoreboard.attributes(),
+                "image_cache_by_url_pattern": {pattern: dict(stats) for pattern, stats in self.image_processor.url_pattern_stats.items()},
+                "pixoo_devices": {device.host: device.status() for device in self.pixoo_devices},
+                "connection_pools": {name: dict(stats) for name, stats in self.pool_stats.items()},
                 "process_duration": "0.00", # Placeholder, updated at end
                 "spotify_frames": media_data.spotify_frames,
                 "pixoo64_channel": self.select_index if self.select_index != 0 else "0",
@@ -4087,21 +5850,19 @@ class Pixoo64_Media_Album_Art(hass.Hass):
 
             # 7. Send Commands (Image first, then Text)
             if not took_over:
-                await self.pixoo_device.send_command(image_cmd)
+                await self.pixoo_device.send_command(image_cmd, kind="image")
                 
                 self.is_art_visible = True
                 self.last_text_payload_hash = None 
                 self.last_progress_str = "" 
                 
                 if full_text_items:
-                    await asyncio.sleep(0.1) 
-                    
                     txt_payload = {"Command": "Draw/SendHttpItemList", "ItemList": full_text_items}
-                    await self.pixoo_device.send_command(txt_payload)
+                    await self.pixoo_device.send_command(txt_payload, kind="text")
                     self.last_text_payload_hash = str(txt_payload)
 
             elif spotify_animation_took_over_display and self.config.special_mode and full_text_items:
-                await self.pixoo_device.send_command({ "Command": "Draw/SendHttpItemList", "ItemList": full_text_items })
+                await self.pixoo_device.send_command({ "Command": "Draw/SendHttpItemList", "ItemList": full_text_items }, kind="text")
 
             # 8. Update Sensor with final duration
             if not spotify_animation_took_over_display:
@@ -4123,10 +5884,10 @@ class Pixoo64_Media_Album_Art(hass.Hass):
                         {"Command": "Draw/ResetHttpGifId"},
                         {"Command": "Draw/SendHttpGif", "PicNum": 1, "PicWidth": 64, "PicOffset": 0, "PicID": 0, "PicSpeed": 1000, "PicData": black_pic}
                     ]
-                })
+                }, kind="image")
                 
                 payloads_text_fail = self.create_payloads(media_data.artist, media_data.title, 11)
-                await self.pixoo_device.send_command(payloads_text_fail)
+                await self.pixoo_device.send_command(payloads_text_fail, kind="text")
                 self.is_art_visible = True
 
         except Exception as e:
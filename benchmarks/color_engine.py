@@ -0,0 +1,73 @@
+"""
+Colour analysis benchmark: Python loops vs. the NumPy engine.
+
+Runs ImageProcessor.img_values on every cover with both engines, checks that they
+pick the same colours and prints the time per cover.
+
+Usage (needs the same packages as the app, plus numpy):
+    python benchmarks/color_engine.py [image files...]
+Without arguments a set of synthetic covers is used.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "apps", "pixoo64_media_album_art"))
+
+from PIL import Image, ImageDraw  # noqa: E402
+
+import pixoo64_media_album_art as app  # noqa: E402
+
+
+def synthetic_covers(count=40):
+    rnd = random.Random(1)
+    covers = []
+    for _ in range(count):
+        img = Image.new("RGB", (64, 64), tuple(rnd.randint(0, 255) for _ in range(3)))
+        draw = ImageDraw.Draw(img)
+        for _ in range(25):
+            x, y = rnd.randint(-10, 60), rnd.randint(-10, 60)
+            draw.ellipse([x, y, x + rnd.randint(4, 40), y + rnd.randint(4, 40)], fill=tuple(rnd.randint(0, 255) for _ in range(3)))
+        covers.append(img)
+    return covers
+
+
+def load_covers(paths):
+    return [Image.open(p).convert("RGB").resize((64, 64), Image.Resampling.BICUBIC) for p in paths]
+
+
+def make_processor(engine, **settings):
+    config = app.Config({"pixoo": {"url": "127.0.0.1", "color_engine": engine, "frame_store": 0}})
+    for key, value in settings.items():
+        setattr(config, key, value)
+    return app.ImageProcessor(config, session=None)
+
+
+def run(processor, covers, rounds):
+    start = time.perf_counter()
+    results = []
+    for _ in range(rounds):
+        results = [processor.img_values(img) for img in covers]
+    return (time.perf_counter() - start) / (rounds * len(covers)), results
+
+
+def main():
+    if not app.numpy_support:
+        sys.exit("numpy is not installed")
+    covers = load_covers(sys.argv[1:]) if len(sys.argv) > 1 else synthetic_covers()
+    rounds = 5
+    for label, settings in (("text_background off", {"text_bg": False}), ("text_background on", {"text_bg": True})):
+        py_time, py_results = run(make_processor("python", **settings), covers, rounds)
+        np_time, np_results = run(make_processor("numpy", **settings), covers, rounds)
+        same = py_results == np_results
+        print(f"{label:20s} python {py_time * 1000:7.3f} ms/cover   numpy {np_time * 1000:7.3f} ms/cover   "
+              f"speed-up x{py_time / np_time:4.2f}   identical={same}")
+        if not same:
+            sys.exit(1)
+    for proc in (make_processor("python"),):
+        proc.shutdown()
+
+
+if __name__ == "__main__":
+    main()
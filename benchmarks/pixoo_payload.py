@@ -0,0 +1,83 @@
+"""
+Pixoo command encoding benchmark: per-call cost of preparing an image command.
+
+"before" is what send_command used to do: json.dumps(sort_keys=True) for the
+duplicate check, a string comparison with the previous payload, and a second
+json.dumps inside aiohttp for the request body. "after" is
+PixooDevice.encode_payload plus the digest used for the duplicate check.
+
+Usage (needs the same packages as the app):
+    python benchmarks/pixoo_payload.py
+"""
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "apps", "pixoo64_media_album_art"))
+
+from PIL import Image  # noqa: E402
+
+import pixoo64_media_album_art as app  # noqa: E402
+
+
+def image_commands(count=20):
+    rnd = random.Random(1)
+    config = app.Config({"pixoo": {"url": "127.0.0.1", "frame_store": 0}})
+    processor = app.ImageProcessor(config, session=None)
+    commands = []
+    for _ in range(count):
+        img = Image.frombytes("RGB", (64, 64), bytes(rnd.getrandbits(8) for _ in range(64 * 64 * 3)))
+        commands.append({
+            "Command": "Draw/CommandList",
+            "CommandList": [
+                {"Command": "Channel/OnOffScreen", "OnOff": 1},
+                {"Command": "Draw/ResetHttpGifId"},
+                {"Command": "Draw/SendHttpGif", "PicNum": 1, "PicWidth": 64, "PicOffset": 0, "PicID": 0, "PicSpeed": 10000, "PicData": processor.gbase64(img)},
+            ],
+        })
+    processor.shutdown()
+    return commands
+
+
+def before(commands):
+    last = None
+    for command in commands:
+        current = json.dumps(command, sort_keys=True)
+        if current == last:
+            continue
+        last = current
+        json.dumps(command).encode("utf-8")
+
+
+def after(commands):
+    last = None
+    for command in commands:
+        body = app.PixooDevice.encode_payload(command)
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if digest == last:
+            continue
+        last = digest
+
+
+def timed(fn, commands, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(commands)
+    return (time.perf_counter() - start) / (rounds * len(commands))
+
+
+def main():
+    commands = image_commands()
+    rounds = 200
+    print(f"payload size {len(app.PixooDevice.encode_payload(commands[0]))} bytes")
+    before_time = timed(before, commands, rounds)
+    after_time = timed(after, commands, rounds)
+    print(f"before {before_time * 1e6:7.1f} us/command   after {after_time * 1e6:7.1f} us/command   "
+          f"saved {(before_time - after_time) * 1e6:6.1f} us (x{before_time / after_time:4.2f})")
+
+
+if __name__ == "__main__":
+    main()
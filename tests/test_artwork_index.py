@@ -0,0 +1,59 @@
+import pixoo64_media_album_art as app
+
+PROVIDERS = ["discogs", "lastfm"]
+
+
+def make_index(tmp_path, ttl=3600.0, providers=PROVIDERS):
+    return app.ArtworkIndex(str(tmp_path / "index.sqlite3"), ttl, providers)
+
+
+def test_store_and_lookup_with_normalised_key(tmp_path):
+    index = make_index(tmp_path)
+    index.store("The Artist", "Song!", "Album", "https://img/1.jpg", "Discogs")
+    assert index.lookup("the artist", "song", "album") == ("https://img/1.jpg", "Discogs", False)
+    assert index.lookup("The Artist", "Other", "Album") is None
+    assert index.hits == 1
+    index.close()
+
+
+def test_entries_survive_reopen(tmp_path):
+    index = make_index(tmp_path)
+    index.store("A", "B", None, "https://img/1.jpg", "Last.FM")
+    index.close()
+    reopened = make_index(tmp_path)
+    assert reopened.lookup("A", "B", None)[0] == "https://img/1.jpg"
+    reopened.close()
+
+
+def test_old_entries_are_stale_until_confirmed(tmp_path):
+    index = make_index(tmp_path, ttl=-1)
+    index.store("A", "B", "C", "https://img/1.jpg", "Discogs")
+    assert index.lookup("A", "B", "C")[2] is True
+    index.ttl = 3600
+    index.confirm("A", "B", "C")
+    assert index.lookup("A", "B", "C")[2] is False
+    index.close()
+
+
+def test_forget_removes_the_entry(tmp_path):
+    index = make_index(tmp_path)
+    index.store("A", "B", "C", "https://img/1.jpg", "Discogs")
+    index.forget("A", "B", "C")
+    assert index.lookup("A", "B", "C") is None
+    index.close()
+
+
+def test_changed_providers_empty_the_index(tmp_path):
+    index = make_index(tmp_path)
+    index.store("A", "B", "C", "https://img/1.jpg", "Discogs")
+    index.close()
+    reopened = make_index(tmp_path, providers=["discogs", "lastfm", "tidal"])
+    assert reopened.lookup("A", "B", "C") is None
+    reopened.close()
+
+
+def test_closed_index_answers_nothing(tmp_path):
+    index = make_index(tmp_path)
+    index.close()
+    assert index.lookup("A", "B", "C") is None
+    index.store("A", "B", "C", "https://img/1.jpg", "Discogs")
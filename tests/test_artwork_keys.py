@@ -0,0 +1,48 @@
+import pixoo64_media_album_art as app
+
+
+def test_ha_proxy_url_drops_the_rotating_token():
+    first = "/api/media_player_proxy/media_player.living_room?token=abc&cache=1234"
+    second = "/api/media_player_proxy/media_player.living_room?token=xyz&cache=1234"
+    key, pattern = app.canonical_picture_key(first)
+    assert pattern == "ha_media_player_proxy"
+    assert key == app.canonical_picture_key(second)[0]
+    assert "token" not in key
+
+
+def test_ha_proxy_url_keeps_the_content_hash():
+    first = app.canonical_picture_key("/api/image_proxy/image.cover?token=a&cache=1")[0]
+    second = app.canonical_picture_key("/api/image_proxy/image.cover?token=a&cache=2")[0]
+    assert first != second
+
+
+def test_ha_proxy_url_without_cache_hash_is_kept_whole():
+    url = "/api/media_player_proxy/media_player.tv?token=abc"
+    assert app.canonical_picture_key(url) == (url, "ha_media_player_proxy_uncached")
+
+
+def test_signed_path_drops_auth_signature():
+    key, pattern = app.canonical_picture_key("/api/tts_proxy/cover.jpg?authSig=abc.def")
+    assert (key, pattern) == ("/api/tts_proxy/cover.jpg", "ha_signed_path")
+
+
+def test_ai_url_drops_the_api_key():
+    base = app.AI_IMAGE_BASE_URL + "prompt?model=flux&width=512&height=512&seed=7"
+    key, pattern = app.canonical_picture_key(base + "&key=sk_secret")
+    assert pattern == "ai_generated"
+    assert key == app.canonical_picture_key(base)[0]
+    assert "sk_secret" not in key
+
+
+def test_other_urls_are_keyed_as_is_by_host():
+    url = "https://i.scdn.co/image/abc?x=1"
+    assert app.canonical_picture_key(url) == (url, "i.scdn.co")
+    assert app.canonical_picture_key("cover.jpg") == ("cover.jpg", "other")
+
+
+def test_select_image_variant_prefers_smallest_sufficient_edge():
+    variants = [(640, "large"), (300, "medium"), (64, "small")]
+    assert app.select_image_variant(variants, 240) == "medium"
+    assert app.select_image_variant(variants, 64) == "small"
+    assert app.select_image_variant(variants, 1000) == "large"
+    assert app.select_image_variant([(0, "unknown"), (300, None)], 64) is None
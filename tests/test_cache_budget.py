@@ -0,0 +1,46 @@
+from PIL import Image
+
+import pixoo64_media_album_art as app
+
+META = {'font_color': '#ffffff', 'background_color_rgb': (10, 20, 30)}
+
+
+def processor(tmp_path, budget_mb):
+    config = app.Config({"pixoo": {"url": "127.0.0.1", "cache_dir": str(tmp_path), "cache_memory_mb": budget_mb}})
+    return app.ImageProcessor(config, session=None)
+
+
+def cover(value):
+    return Image.new("RGB", (64, 64), (value, value, value))
+
+
+def test_stage_caches_are_counted_in_the_budget(tmp_path):
+    proc = processor(tmp_path, 1)
+    try:
+        proc._stage_put(proc._base_cache, ("base", 1), cover(1))
+        proc._stage_put(proc._filtered_cache, ("filtered", 1), {'image': cover(1), 'values': {}})
+        proc._cache_put("final", {'pil_image': cover(1), **META})
+        expected = (app.ImageProcessor._stage_nbytes(("base", 1), cover(1))
+                    + app.ImageProcessor._stage_nbytes(("filtered", 1), {'image': cover(1), 'values': {}})
+                    + proc.image_cache["final"].nbytes("final"))
+        assert proc._current_cache_memory == expected
+
+        proc._stage_put(proc._base_cache, ("base", 1), cover(2))
+        assert proc._current_cache_memory == expected
+    finally:
+        proc.shutdown()
+
+
+def test_budget_evicts_stage_entries_before_final_frames(tmp_path):
+    proc = processor(tmp_path, 0.1)
+    try:
+        for i in range(4):
+            proc._stage_put(proc._base_cache, ("base", i), cover(i))
+        for i in range(8):
+            proc._cache_put(f"final-{i}", {'pil_image': cover(i), **META})
+            assert proc._current_cache_memory <= proc.cache_budget
+
+        assert len(proc._base_cache) == 0
+        assert len(proc.image_cache) == 8
+    finally:
+        proc.shutdown()
@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+import pixoo64_media_album_art as app
+
+
+@pytest.fixture
+def processor(tmp_path):
+    config = app.Config({"pixoo": {"url": "127.0.0.1", "cache_dir": str(tmp_path)}})
+    proc = app.ImageProcessor(config, session=None)
+    yield proc
+    proc.shutdown()
+
+
+def test_work_continues_while_another_caller_waits(processor):
+    async def run():
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "frame"
+
+        first = asyncio.ensure_future(processor._coalesced(("image", "a"), work))
+        second = asyncio.ensure_future(processor._coalesced(("image", "a"), work))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return await second, first.cancelled()
+
+    assert asyncio.run(run()) == ("frame", True)
+    assert processor.coalesce_stats == {'started': 1, 'coalesced': 1}
+
+
+def test_work_is_cancelled_once_every_caller_gave_up(processor):
+    async def run():
+        state = {'cancelled': False}
+
+        async def work():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                state['cancelled'] = True
+                raise
+
+        callers = [asyncio.ensure_future(processor._coalesced(("download", "url"), work)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+        return state['cancelled']
+
+    assert asyncio.run(run())
+    assert not processor._inflight
+    assert not processor._waiters
@@ -0,0 +1,80 @@
+import random
+
+import pytest
+from PIL import Image, ImageDraw
+
+import pixoo64_media_album_art as app
+
+pytest.importorskip("numpy")
+
+
+def covers(count=20):
+    rnd = random.Random(7)
+    images = []
+    for _ in range(count):
+        img = Image.new("RGB", (64, 64), tuple(rnd.randint(0, 255) for _ in range(3)))
+        draw = ImageDraw.Draw(img)
+        for _ in range(20):
+            x, y = rnd.randint(-10, 60), rnd.randint(-10, 60)
+            draw.ellipse([x, y, x + rnd.randint(4, 40), y + rnd.randint(4, 40)], fill=tuple(rnd.randint(0, 255) for _ in range(3)))
+        images.append(img)
+    return images
+
+
+def processor(tmp_path, engine, **settings):
+    config = app.Config({"pixoo": {"url": "127.0.0.1", "color_engine": engine, "cache_dir": str(tmp_path)}})
+    for key, value in settings.items():
+        setattr(config, key, value)
+    return app.ImageProcessor(config, session=None)
+
+
+@pytest.mark.parametrize("text_bg", [False, True])
+@pytest.mark.parametrize("top_text", [False, True])
+def test_numpy_engine_picks_the_same_colours(tmp_path, text_bg, top_text):
+    python = processor(tmp_path, "python", text_bg=text_bg, top_text=top_text)
+    vector = processor(tmp_path, "numpy", text_bg=text_bg, top_text=top_text)
+    assert python._vector_engine is None
+    assert vector._vector_engine is not None
+    try:
+        for img in covers():
+            assert vector.img_values(img) == python.img_values(img)
+    finally:
+        python.shutdown()
+        vector.shutdown()
+
+
+def test_border_scan_matches_python(tmp_path):
+    python = processor(tmp_path, "python")
+    engine = app.VectorColorEngine()
+    try:
+        for img in covers(10):
+            window = Image.new("RGB", (64, 80), (0, 0, 0))
+            window.paste(img, (0, 8))
+            for thresh in (10, 40):
+                assert engine.border_rows(window, (0, 0, 0), thresh) == python._border_rows(window, (0, 0, 0), thresh)
+    finally:
+        python.shutdown()
+
+
+def test_auto_uses_python_analysis_with_text_background(tmp_path):
+    auto = processor(tmp_path, "auto", text_bg=True)
+    try:
+        assert auto._vector_engine is None
+        auto.config.text_bg = False
+        assert auto._vector_engine is not None
+    finally:
+        auto.shutdown()
+
+
+def test_border_scan_uses_numpy_whatever_the_colour_engine(tmp_path, monkeypatch):
+    calls = []
+    scan = app.VectorColorEngine.border_rows
+    monkeypatch.setattr(app.VectorColorEngine, "border_rows", staticmethod(lambda *args: calls.append(args) or scan(*args)))
+    python = processor(tmp_path, "python")
+    try:
+        img = Image.new("RGB", (64, 80), (0, 0, 0))
+        img.paste(covers(1)[0], (0, 8))
+        python._balance_border(img, img, 0, 0, 64, (0, 0, 0), 40)
+    finally:
+        python.shutdown()
+    assert calls
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+import pixoo64_media_album_art as app
+
+
+class FakeResponse:
+    def __init__(self, status, data):
+        self.status = status
+        self._data = data
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+    async def json(self):
+        return self._data
+
+
+class FakeSession:
+    """Answers each GET with the (status, json) of the first route whose text is in the URL."""
+
+    closed = False
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(url)
+        for fragment, answer in self.routes.items():
+            if fragment in url:
+                return FakeResponse(*answer)
+        return FakeResponse(404, {})
+
+
+MUSICBRAINZ_NO_ART = {
+    "musicbrainz.org": (200, {"releases": [{"id": "release-1"}]}),
+    "coverartarchive.org": (404, {}),
+}
+DISCOGS_NO_COVER = {"api.discogs.com": (200, {"results": [{"title": "Album", "cover_image": ""}]})}
+
+
+@pytest.fixture
+def service(tmp_path):
+    config = app.Config({
+        "pixoo": {"url": "127.0.0.1", "cache_dir": str(tmp_path)},
+        "home_assistant": {"discogs": "token", "artwork_index_days": 0},
+    })
+    processor = app.ImageProcessor(config, session=None)
+    fallback = app.FallbackService(config, processor, FakeSession({}), spotify_service=None, pixoo_device=None)
+    yield fallback
+    fallback.close_negative_cache()
+    processor.shutdown()
+
+
+@pytest.mark.parametrize("provider, routes, search", [
+    ("musicbrainz", MUSICBRAINZ_NO_ART, "get_musicbrainz_album_art_url"),
+    ("discogs", DISCOGS_NO_COVER, "search_discogs_album_art"),
+])
+def test_no_artwork_answer_is_remembered(service, provider, routes, search):
+    async def run():
+        service.session = FakeSession(routes)
+        assert await getattr(service, search)("Artist", "Title") is None
+        calls = len(service.session.calls)
+        assert await getattr(service, search)("Artist", "Title") is None
+        return calls, len(service.session.calls)
+
+    first, second = asyncio.run(run())
+    assert first > 0
+    assert second == first
+    assert service.negative_cache.is_miss(provider, "artist", "title")
+
+
+def test_server_errors_are_not_remembered(service):
+    async def run():
+        service.session = FakeSession({"musicbrainz.org": MUSICBRAINZ_NO_ART["musicbrainz.org"], "coverartarchive.org": (503, {})})
+        return await service.get_musicbrainz_album_art_url("Artist", "Title")
+
+    assert asyncio.run(run()) is None
+    assert not service.negative_cache.is_miss("musicbrainz", "Artist", "Title")
+
+
+@pytest.mark.parametrize("provider, routes, search", [
+    ("musicbrainz", MUSICBRAINZ_NO_ART, "get_musicbrainz_album_art_url"),
+    ("discogs", DISCOGS_NO_COVER, "search_discogs_album_art"),
+])
+def test_no_artwork_answers_do_not_trip_the_circuit(service, provider, routes, search):
+    async def run():
+        service.session = FakeSession(routes)
+        for title in ("One", "Two", "Three", "Four"):
+            assert await service._scored_lookup(provider, getattr(service, search), "Artist", title) is None
+
+    asyncio.run(run())
+    assert service.scoreboard.available(provider)
+    assert [outcome for outcome, _ in service.scoreboard._entry(provider)['samples']] == ['miss'] * 4
+
+
+def test_server_errors_still_trip_the_circuit(service):
+    async def run():
+        service.session = FakeSession({"musicbrainz.org": (503, {})})
+        for title in ("One", "Two", "Three"):
+            await service._scored_lookup("musicbrainz", service.get_musicbrainz_album_art_url, "Artist", title)
+
+    asyncio.run(run())
+    assert not service.scoreboard.available("musicbrainz")
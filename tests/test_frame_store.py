@@ -0,0 +1,144 @@
+import os
+
+from PIL import Image
+
+import pixoo64_media_album_art as app
+
+META = {'font_color': '#ffffff', 'background_color_rgb': (10, 20, 30)}
+
+
+def frame(value: int) -> bytes:
+    return bytes([value]) * app.FRAME_SIZE
+
+
+def test_round_trip_survives_reopen(tmp_path):
+    store = app.FrameStore(str(tmp_path), 4)
+    assert store.put("cover-a", frame(1), META)
+    view, meta = store.get("cover-a")
+    assert bytes(view) == frame(1)
+    assert meta == META
+    view.release()
+    store.close()
+
+    reopened = app.FrameStore(str(tmp_path), 4)
+    view, meta = reopened.get("cover-a")
+    assert bytes(view) == frame(1)
+    assert meta['background_color_rgb'] == (10, 20, 30)
+    view.release()
+    reopened.close()
+
+
+def test_rejects_frames_of_the_wrong_size(tmp_path):
+    store = app.FrameStore(str(tmp_path), 2)
+    assert not store.put("cover", b"\x00" * 10, META)
+    assert len(store) == 0
+    store.close()
+
+
+def test_evicts_least_recently_used_slot(tmp_path):
+    store = app.FrameStore(str(tmp_path), 2)
+    store.put("a", frame(1), META)
+    store.put("b", frame(2), META)
+    store.get("a")[0].release()
+    store.put("c", frame(3), META)
+
+    assert store.get("b") is None
+    assert bytes(store.get("a")[0]) == frame(1)
+    assert bytes(store.get("c")[0]) == frame(3)
+    assert len(store) == 2
+    store.close()
+
+
+def test_overwriting_a_key_reuses_its_slot(tmp_path):
+    store = app.FrameStore(str(tmp_path), 2)
+    store.put("a", frame(1), META)
+    store.put("a", frame(5), META)
+    store.put("b", frame(2), META)
+
+    assert bytes(store.get("a")[0]) == frame(5)
+    assert bytes(store.get("b")[0]) == frame(2)
+    store.close()
+
+
+def test_torn_write_is_detected_by_crc(tmp_path):
+    store = app.FrameStore(str(tmp_path), 1)
+    store.put("a", frame(1), META)
+    # Unclean shutdown halfway through replacing the pixels: the record still names the old frame.
+    start = store.RECORD_SIZE
+    store._mmap[start:start + 100] = frame(2)[:100]
+    store._mmap.flush()
+    store._mmap.close()
+    store._file.close()
+
+    reopened = app.FrameStore(str(tmp_path), 1)
+    assert reopened.get("a") is None
+    assert len(reopened) == 0
+    assert reopened.put("c", frame(3), META)
+    reopened.close()
+
+
+def test_lru_order_survives_reopen(tmp_path):
+    store = app.FrameStore(str(tmp_path), 2)
+    store.put("a", frame(1), META)
+    store.put("b", frame(2), META)
+    store.get("a")[0].release()
+    store.close()
+
+    reopened = app.FrameStore(str(tmp_path), 2)
+    reopened.put("c", frame(3), META)
+    assert reopened.get("b") is None
+    assert bytes(reopened.get("a")[0]) == frame(1)
+    reopened.close()
+
+
+def test_data_file_of_another_layout_starts_empty(tmp_path):
+    with open(os.path.join(str(tmp_path), "frames.bin"), "wb") as f:
+        f.write(frame(7) * 2)
+    with open(os.path.join(str(tmp_path), "frames.idx"), "w", encoding="utf-8") as f:
+        f.write("{not json")
+
+    store = app.FrameStore(str(tmp_path), 2)
+    assert len(store) == 0
+    assert not os.path.exists(os.path.join(str(tmp_path), "frames.idx"))
+    assert store.put("b", frame(2), META)
+    store.close()
+
+
+def test_metadata_that_does_not_fit_a_record_is_refused(tmp_path):
+    store = app.FrameStore(str(tmp_path), 2)
+    assert not store.put("a", frame(1), {'font_color': 'x' * store.RECORD_SIZE})
+    assert not store.put("b", frame(1), {'font_color': object()})
+    assert len(store) == 0
+    store.close()
+
+
+def test_clear_survives_reopen(tmp_path):
+    store = app.FrameStore(str(tmp_path), 2)
+    store.put("a", frame(1), META)
+    store.clear()
+    store.close()
+
+    reopened = app.FrameStore(str(tmp_path), 2)
+    assert len(reopened) == 0
+    reopened.close()
+
+
+def test_processor_keeps_small_frames_in_memory_next_to_the_store(tmp_path):
+    config = app.Config({"pixoo": {"url": "127.0.0.1", "cache_dir": str(tmp_path), "frame_store": 4}})
+    processor = app.ImageProcessor(config, session=None)
+    try:
+        small = Image.new("RGB", (40, 40), (1, 2, 3))
+        full = Image.new("RGB", (64, 64), (4, 5, 6))
+        processor._cache_put("small", {'pil_image': small, **META})
+        processor._cache_put("full", {'pil_image': full, **META})
+
+        cached = processor._cache_get("small")
+        assert cached['frame_size'] == (40, 40)
+        assert bytes(cached['frame']) == small.tobytes()
+        stored = processor._cache_get("full")
+        assert bytes(stored['frame']) == full.tobytes()
+        stored['frame'].release()
+        assert len(processor.frame_store) == 1
+        assert len(processor.image_cache) == 1
+    finally:
+        processor.shutdown()
@@ -0,0 +1,58 @@
+import json
+import time
+
+import pixoo64_media_album_art as app
+
+CREDENTIALS = {"spotify": ("id", "secret"), "discogs": "token"}
+
+
+def make_cache(tmp_path, ttl=60.0, credentials=CREDENTIALS):
+    return app.NegativeCache(str(tmp_path / "negative.json"), ttl, credentials)
+
+
+def test_miss_matches_normalised_artist_and_title(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.record_miss("spotify", "The Artist", "Song (Live)")
+    assert cache.is_miss("spotify", "the artist", "song live")
+    assert not cache.is_miss("discogs", "The Artist", "Song (Live)")
+    assert cache.hits == 1
+
+
+def test_entries_expire(tmp_path):
+    cache = make_cache(tmp_path, ttl=0.01)
+    cache.record_miss("spotify", "A", "B")
+    time.sleep(0.02)
+    assert not cache.is_miss("spotify", "A", "B")
+
+
+def test_round_trip_through_disk(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.record_miss("spotify", "A", "B")
+    cache.write(cache.snapshot())
+    assert make_cache(tmp_path).is_miss("spotify", "A", "B")
+
+
+def test_changed_credentials_drop_that_providers_entries(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.record_miss("spotify", "A", "B")
+    cache.record_miss("discogs", "A", "B")
+    cache.write(cache.snapshot())
+
+    reloaded = make_cache(tmp_path, credentials={"spotify": ("id", "other"), "discogs": "token"})
+    assert not reloaded.is_miss("spotify", "A", "B")
+    assert reloaded.is_miss("discogs", "A", "B")
+
+
+def test_unreadable_file_starts_empty(tmp_path):
+    (tmp_path / "negative.json").write_text("[1, 2", encoding="utf-8")
+    cache = make_cache(tmp_path)
+    assert not cache.is_miss("spotify", "A", "B")
+
+
+def test_snapshot_leaves_out_expired_entries(tmp_path):
+    cache = make_cache(tmp_path, ttl=0.01)
+    cache.record_miss("spotify", "A", "B")
+    time.sleep(0.02)
+    cache.write(cache.snapshot())
+    with open(cache.path, encoding="utf-8") as f:
+        assert json.load(f)["entries"] == {}
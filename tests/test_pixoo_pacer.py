@@ -0,0 +1,58 @@
+import pixoo64_media_album_art as app
+
+
+def test_starts_at_and_never_exceeds_the_cap():
+    pacer = app.PixooPacer(4)
+    assert pacer.rate == 4
+    for _ in range(50):
+        pacer.success(0.05)
+    assert pacer.rate == 4
+    assert pacer.gap == 0.25
+
+
+def test_default_cap_is_the_old_fixed_pacing():
+    assert app.PixooPacer().gap == 0.1
+
+
+def test_failures_halve_the_rate_down_to_the_floor():
+    pacer = app.PixooPacer()
+    pacer.failure()
+    assert pacer.rate == 5
+    for _ in range(20):
+        pacer.failure()
+    assert pacer.rate == pacer.MIN_RATE
+
+
+def test_successes_recover_additively():
+    pacer = app.PixooPacer()
+    pacer.failure()
+    pacer.success(0.05)
+    assert pacer.rate == 6
+    for _ in range(10):
+        pacer.success(0.05)
+    assert pacer.rate == 10
+
+
+def test_timeout_tracks_rtt_and_doubles_on_timeouts():
+    pacer = app.PixooPacer()
+    for _ in range(20):
+        pacer.success(0.05)
+    assert pacer.timeout == pacer.MIN_TIMEOUT
+    pacer.failure(timed_out=True)
+    assert pacer.timeout == 2 * pacer.MIN_TIMEOUT
+    for _ in range(10):
+        pacer.failure(timed_out=True)
+    assert pacer.timeout == pacer.MAX_TIMEOUT
+
+    slow = app.PixooPacer()
+    for _ in range(20):
+        slow.success(3.0)
+    assert 3.0 <= slow.timeout <= slow.MAX_TIMEOUT
+
+
+def test_error_rate_over_recent_window():
+    pacer = app.PixooPacer()
+    pacer.success(0.05)
+    pacer.failure()
+    assert pacer.error_rate == 0.5
+    assert pacer.attributes()["gap_ms"] == 200.0
@@ -0,0 +1,59 @@
+import pixoo64_media_album_art as app
+
+
+def test_cold_providers_use_their_fixed_timeout():
+    board = app.ProviderScoreboard({"musicbrainz": 20.0})
+    assert board.timeout("discogs") == board.COLD_TIMEOUT
+    assert board.timeout("musicbrainz") == 20.0
+
+
+def test_timeout_follows_p90_latency():
+    board = app.ProviderScoreboard()
+    for latency in (0.1, 0.2, 0.3, 0.4, 2.0):
+        board.record("lastfm", "hit", latency)
+    # p90 of five samples is the largest one.
+    assert board.timeout("lastfm") == 6.0
+
+    board = app.ProviderScoreboard()
+    for latency in (0.1,) * 9 + (1.5,):
+        board.record("lastfm", "miss", latency)
+    assert board.timeout("lastfm") == board.MIN_TIMEOUT
+
+
+def test_timeout_never_exceeds_the_cold_timeout():
+    board = app.ProviderScoreboard()
+    for _ in range(10):
+        board.record("discogs", "hit", 8.0)
+    assert board.timeout("discogs") == board.COLD_TIMEOUT
+
+
+def test_orders_by_hit_rate_then_latency():
+    board = app.ProviderScoreboard()
+    for _ in range(5):
+        board.record("slow_hit", "hit", 2.0)
+        board.record("fast_hit", "hit", 0.2)
+        board.record("fast_miss", "miss", 0.1)
+    assert board.order(["fast_miss", "slow_hit", "fast_hit", "new"]) == ["fast_hit", "slow_hit", "new", "fast_miss"]
+
+
+def test_circuit_opens_after_consecutive_errors_and_resets_on_answer(monkeypatch):
+    board = app.ProviderScoreboard()
+    now = [1000.0]
+    monkeypatch.setattr(app.time, "time", lambda: now[0])
+
+    for _ in range(board.FAILURE_THRESHOLD):
+        assert board.available("tidal")
+        board.record("tidal", "error", 1.0)
+    assert not board.available("tidal")
+
+    now[0] += board.BASE_COOLDOWN
+    assert board.available("tidal")
+    board.record("tidal", "error", 1.0)
+    # One more error after the cooldown re-opens it for twice as long.
+    assert not board.available("tidal")
+    now[0] += board.BASE_COOLDOWN
+    assert not board.available("tidal")
+    now[0] += board.BASE_COOLDOWN
+    board.record("tidal", "miss", 0.5)
+    assert board.available("tidal")
+    assert board.attributes()["tidal"]["circuit"] == "closed"